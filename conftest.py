@@ -0,0 +1,11 @@
+"""
+Shared pytest setup: make the project root importable (``from lib import ...``)
+for every test module, so the modules need no sys.path boilerplate of their own.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
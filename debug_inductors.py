@@ -5,7 +5,9 @@ Debug script to analyze inductor filtering logic
 
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'lib'))
+LIB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lib')
+if LIB_DIR not in sys.path:
+    sys.path.insert(0, LIB_DIR)
 
 from component_data import INDUCTOR_LIBRARY
 from calculations import CircuitCalculator, BuckInputs
@@ -98,7 +98,8 @@ class CircuitCalculator:
         Calculate Buck converter component values
         
         Args:
-            inputs: Buck converter input parameters
+            inputs: Buck converter input parameters; fields may be NumPy arrays
+                to size many designs in one call
             
         Returns:
             BuckResults with calculated component values
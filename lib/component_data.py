@@ -3,12 +3,15 @@ Component library data structures and database
 Now loads data from CSV files in the assets folder
 """
 
+import functools
 import os
+import threading
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, fields
+from typing import Dict, List
 
-@dataclass
+@dataclass(frozen=True)
 class MOSFET:
     """MOSFET component specification with extended heuristics parameters"""
     name: str
@@ -32,7 +35,7 @@ class MOSFET:
     rdson_at_125c: float = 0.0  # RDS(on) at 125°C for temperature derating (mΩ)
     mosfet_type: str = "Si"  # Si or SiC - affects VDS derating factors
 
-@dataclass
+@dataclass(frozen=True)
 class Capacitor:
     """Output Capacitor component specification"""
     part_number: str
@@ -44,7 +47,7 @@ class Capacitor:
     primary_use: str
     temp_range: str
 
-@dataclass
+@dataclass(frozen=True)
 class InputCapacitor:
     """Input Capacitor component specification with ripple current handling"""
     part_number: str
@@ -62,7 +65,7 @@ class InputCapacitor:
     availability: str
     notes: str
 
-@dataclass
+@dataclass(frozen=True)
 class Inductor:
     """Inductor component specification"""
     part_number: str
@@ -77,6 +80,76 @@ class Inductor:
     temp_range: str = ""  # New field
 
 
+# Lightweight records for web search results, shaped like the library dataclasses
+@dataclass(frozen=True)
+class WebMOSFET:
+    """MOSFET found by web search, with distributor pricing and stock"""
+    name: str
+    manufacturer: str
+    vds: float  # V
+    id: float  # A
+    rdson: float  # mΩ
+    qg: float  # nC
+    package: str
+    typical_use: str
+    efficiency_range: str
+    price: str
+    availability: str
+    distributor: str
+
+@dataclass(frozen=True)
+class WebCapacitor:
+    """Output capacitor found by web search, with distributor pricing and stock"""
+    part_number: str
+    manufacturer: str
+    capacitance: float  # µF
+    voltage: float  # V
+    type: str
+    esr: str  # mΩ
+    primary_use: str
+    temp_range: str
+    price: str
+    availability: str
+    distributor: str
+
+@dataclass(frozen=True)
+class WebInputCapacitor:
+    """Input capacitor found by web search, with distributor pricing and stock"""
+    part_number: str
+    manufacturer: str
+    category: str
+    dielectric: str
+    capacitance: float  # µF
+    voltage: float  # V
+    esr: float  # mΩ
+    esl: float  # nH
+    ripple_rating: float  # A
+    lifetime: float  # hours
+    package: str
+    cost: float  # USD
+    availability: str
+    notes: str
+    price: str
+    distributor: str
+
+@dataclass(frozen=True)
+class WebInductor:
+    """Inductor found by web search, with distributor pricing and stock"""
+    part_number: str
+    manufacturer: str
+    inductance: float  # µH
+    current: float  # A
+    dcr: float  # mΩ
+    sat_current: float  # A
+    package: str
+    shielded: bool
+    core_material: str
+    temp_range: str
+    price: str
+    availability: str
+    distributor: str
+
+
 def load_mosfets_from_excel() -> List[MOSFET]:
     """Load MOSFETs from PowerCrux Excel file (PRIMARY SOURCE)"""
     try:
@@ -509,19 +582,72 @@ def get_fallback_inductors() -> List[Inductor]:
 
 
 # Load data from Excel files (PRIMARY) with CSV fallback
-MOSFET_LIBRARY: List[MOSFET] = load_mosfets_from_excel()
-INDUCTOR_LIBRARY: List[Inductor] = load_inductors_from_excel()
-INPUT_CAPACITOR_LIBRARY: List[InputCapacitor] = load_input_capacitors_from_excel()
-CAPACITOR_LIBRARY: List[Capacitor] = load_capacitors_from_csv()  # Output capacitors (CSV only)
+_LIBRARY_LOADERS = {
+    'MOSFET_LIBRARY': load_mosfets_from_excel,
+    'INDUCTOR_LIBRARY': load_inductors_from_excel,
+    'INPUT_CAPACITOR_LIBRARY': load_input_capacitors_from_excel,
+    'CAPACITOR_LIBRARY': load_capacitors_from_csv,  # Output capacitors (CSV only)
+}
+
+
+_LIBRARY_LOCK = threading.Lock()
+
+
+@functools.cache
+def _load_library(name: str) -> list:
+    return _LIBRARY_LOADERS[name]()
+
+
+def get_library(name: str) -> list:
+    """Load a component library once and return the cached list on later calls"""
+    # Serialized so threads asking for the same library at once share a single load
+    with _LIBRARY_LOCK:
+        return _load_library(name)
+
+
+_LIBRARY_TYPES = {
+    'MOSFET_LIBRARY': MOSFET,
+    'INDUCTOR_LIBRARY': Inductor,
+    'INPUT_CAPACITOR_LIBRARY': InputCapacitor,
+    'CAPACITOR_LIBRARY': Capacitor,
+}
+
+
+# Query-independent columns derived once per library load, used by suggestion scoring
+_DERIVED_COLUMNS = {
+    'INDUCTOR_LIBRARY': {
+        'smd_package': lambda columns: np.array(['SO' in package.upper() for package in columns['package']], dtype=bool),
+        'manufacturer_lower': lambda columns: np.array([mfr.lower() for mfr in columns['manufacturer']], dtype=object),
+    },
+}
+
+
+@functools.cache
+def get_library_columns(name: str) -> Dict[str, np.ndarray]:
+    """Column arrays (one per dataclass field, plus derived columns) for vectorized library filtering"""
+    library = get_library(name)
+    columns = {}
+    for field in fields(_LIBRARY_TYPES[name]):
+        values = [getattr(item, field.name) for item in library]
+        columns[field.name] = np.array(values, dtype=np.float64 if field.type is float else object)
+    for column, derive in _DERIVED_COLUMNS.get(name, {}).items():
+        columns[column] = derive(columns)
+    return columns
+
+
+def __getattr__(name: str):
+    """Expose MOSFET_LIBRARY etc. as lazily loaded, cached module attributes"""
+    if name in _LIBRARY_LOADERS:
+        return get_library(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def reload_component_data():
     """Reload all component data from Excel files (with CSV fallback)"""
-    global MOSFET_LIBRARY, CAPACITOR_LIBRARY, INDUCTOR_LIBRARY, INPUT_CAPACITOR_LIBRARY
-    MOSFET_LIBRARY = load_mosfets_from_excel()
-    INDUCTOR_LIBRARY = load_inductors_from_excel()
-    INPUT_CAPACITOR_LIBRARY = load_input_capacitors_from_excel()
-    CAPACITOR_LIBRARY = load_capacitors_from_csv()
+    _load_library.cache_clear()
+    get_library_columns.cache_clear()
+    for name in _LIBRARY_LOADERS:
+        get_library(name)
     print("Component data reloaded from Excel files (with CSV fallback)")
 
 
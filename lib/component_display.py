@@ -5,9 +5,31 @@ Standardized tabular display for all component types
 
 import streamlit as st
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from lib.component_suggestions import ComponentSuggestion
 
+# (column label, component attribute) pairs shown per component type
+TABLE_SPEC_COLUMNS = {
+    'mosfet': [('VDS (V)', 'vds'), ('ID (A)', 'id'), ('RDS(on) (mΩ)', 'rdson')],
+    'capacitor': [('Capacitance (µF)', 'capacitance'), ('Voltage (V)', 'voltage'), ('ESR', 'esr')],
+    'output_capacitor': [('Capacitance (µF)', 'capacitance'), ('Voltage (V)', 'voltage'), ('ESR', 'esr')],
+    'input_capacitor': [('Capacitance (µF)', 'capacitance'), ('Voltage (V)', 'voltage'), ('ESR (mΩ)', 'esr')],
+    'inductor': [('Inductance (µH)', 'inductance'), ('Current (A)', 'current'), ('DCR (mΩ)', 'dcr')],
+}
+
+# Session-state key holding the names of every stored "<type>_suggestions" entry,
+# so they can be invalidated without scanning all of st.session_state
+SUGGESTION_KEYS_STATE = '_suggestion_keys'
+
+def clear_stored_suggestions():
+    """Remove every suggestion list stored by display_component_table from session state"""
+    stored_keys = st.session_state.get(SUGGESTION_KEYS_STATE)
+    if not stored_keys:
+        return
+    for key in stored_keys:
+        st.session_state.pop(key, None)
+    stored_keys.clear()
+
 def create_component_table(suggestions: List[ComponentSuggestion], component_type: str) -> pd.DataFrame:
     """
     Create a streamlined DataFrame for component selection
@@ -22,58 +44,37 @@ def create_component_table(suggestions: List[ComponentSuggestion], component_typ
     if not suggestions:
         return pd.DataFrame()
     
-    data = []
+    comps = [suggestion.component for suggestion in suggestions]
+    n_rows = len(comps)
     
-    for i, suggestion in enumerate(suggestions):
-        comp = suggestion.component
-        
-        # Essential information only - streamlined table
-        row = {
-            'Select': "🔘",  # Click indicator
-            'Part Number': getattr(comp, 'part_number', getattr(comp, 'name', 'N/A')),
-            'Manufacturer': getattr(comp, 'manufacturer', 'N/A'),
-            'Source': getattr(comp, 'distributor', 'Local Database'),
-        }
-        
-        # Add only the most critical specs for quick comparison
-        if component_type == 'mosfet':
-            row.update({
-                'VDS (V)': getattr(comp, 'vds', 'N/A'),
-                'ID (A)': getattr(comp, 'id', 'N/A'), 
-                'RDS(on) (mΩ)': getattr(comp, 'rdson', 'N/A'),
-            })
-            
-        elif component_type in ['capacitor', 'output_capacitor']:
-            row.update({
-                'Capacitance (µF)': getattr(comp, 'capacitance', 'N/A'),
-                'Voltage (V)': getattr(comp, 'voltage', 'N/A'),
-                'ESR': getattr(comp, 'esr', 'N/A'),
-            })
-            
-        elif component_type == 'input_capacitor':
-            row.update({
-                'Capacitance (µF)': getattr(comp, 'capacitance', 'N/A'),
-                'Voltage (V)': getattr(comp, 'voltage', 'N/A'),
-                'ESR (mΩ)': getattr(comp, 'esr', 'N/A'),
-            })
-            
-        elif component_type == 'inductor':
-            row.update({
-                'Inductance (µH)': getattr(comp, 'inductance', 'N/A'),
-                'Current (A)': getattr(comp, 'current', 'N/A'),
-                'DCR (mΩ)': getattr(comp, 'dcr', 'N/A'),
-            })
-        
-        # Add price and availability
-        row.update({
-            'Price': getattr(comp, 'price', 'See distributor'),
-            'Stock': getattr(comp, 'availability', 'Check stock'),
-            'Why?': "🤔 View VDS",  # Clickable VDS reasoning column
-        })
-        
-        data.append(row)
+    # Build the table column-by-column so pandas allocates each column once
+    columns = {
+        'Select': ["🔘"] * n_rows,  # Click indicator
+        'Part Number': [getattr(comp, 'part_number', getattr(comp, 'name', 'N/A')) for comp in comps],
+        'Manufacturer': [getattr(comp, 'manufacturer', 'N/A') for comp in comps],
+        'Source': [getattr(comp, 'distributor', 'Local Database') for comp in comps],
+    }
+    
+    # Add only the most critical specs for quick comparison
+    for column, attr in TABLE_SPEC_COLUMNS.get(component_type, []):
+        columns[column] = [getattr(comp, attr, 'N/A') for comp in comps]
+    
+    # Add price and availability
+    columns['Price'] = [getattr(comp, 'price', 'See distributor') for comp in comps]
+    columns['Stock'] = [getattr(comp, 'availability', 'Check stock') for comp in comps]
+    columns['Why?'] = ["🤔 View VDS"] * n_rows  # Clickable VDS reasoning column
     
-    return pd.DataFrame(data)
+    df = pd.DataFrame(columns)
+    # Web results fill missing specs with 'N/A' next to local floats; stringify only
+    # those mixed columns (blanking missing values first, so they don't read 'None')
+    # so st.dataframe's Arrow conversion never has to fall back
+    for column in df.columns:
+        if df[column].dtype != object:
+            continue
+        values = df[column].fillna('')
+        if values.map(type).nunique() > 1:
+            df[column] = values.astype(str)
+    return df
 
 def create_component_links(part_number: str, manufacturer: str, distributor: str = None) -> Dict[str, str]:
     """
@@ -127,7 +128,8 @@ def filter_suggestions_by_source(suggestions: List[ComponentSuggestion], use_web
         return [s for s in suggestions if not (hasattr(s.component, 'distributor') and getattr(s.component, 'distributor', '') in ['Mouser', 'Digikey'])]
 
 
-def display_component_table(suggestions: List[ComponentSuggestion], component_type: str, title: str):
+def display_component_table(suggestions: List[ComponentSuggestion], component_type: str, title: str,
+                            table: Optional[pd.DataFrame] = None):
     """
     Display components in an interactive table - click to see details
     
@@ -135,6 +137,8 @@ def display_component_table(suggestions: List[ComponentSuggestion], component_ty
         suggestions: List of ComponentSuggestion objects
         component_type: Type of component
         title: Display title for the section
+        table: Prebuilt create_component_table() output for these suggestions,
+            e.g. cached alongside them; built here when omitted
     """
     if not suggestions:
         st.warning(f"No suitable {title.lower()} found for these specifications")
@@ -145,6 +149,7 @@ def display_component_table(suggestions: List[ComponentSuggestion], component_ty
     # Store suggestions in session state with a unique key for this component type
     session_key = f"{component_type}_suggestions"
     st.session_state[session_key] = suggestions
+    st.session_state.setdefault(SUGGESTION_KEYS_STATE, set()).add(session_key)
     
     # Debug information
     if st.checkbox(f"Debug {component_type}", key=f"debug_{component_type}"):
@@ -168,8 +173,8 @@ def display_component_table(suggestions: List[ComponentSuggestion], component_ty
     else:
         st.info(f"📚 Found **{local_count}** components from local database")
     
-    # Create streamlined table
-    df = create_component_table(suggestions, component_type)
+    # Create streamlined table, unless the caller already has it
+    df = table if table is not None else create_component_table(suggestions, component_type)
     
     if df.empty:
         st.warning(f"No {title.lower()} data available")
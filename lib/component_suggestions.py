@@ -4,10 +4,12 @@ Now incorporates design heuristics from documents
 """
 
 from typing import List, Dict, Tuple, Any
+import numpy as np
 from dataclasses import dataclass
+from lib import component_data
 from lib.component_data import (
     MOSFET, Capacitor, Inductor, InputCapacitor,
-    MOSFET_LIBRARY, CAPACITOR_LIBRARY, INDUCTOR_LIBRARY, INPUT_CAPACITOR_LIBRARY
+    WebMOSFET, WebCapacitor, WebInputCapacitor, WebInductor
 )
 
 @dataclass
@@ -26,7 +28,39 @@ class ComponentSuggestion:
             self.selection_details = {}
 
 
-def suggest_mosfets(max_voltage: float, max_current: float, frequency_hz: float = 65000, use_web_search: bool = False) -> List[ComponentSuggestion]:
+def _mosfet_rating_factor(mosfet_type: str, vds_rating_guidelines: List[str],
+                          default_silicon: float, default_sic: float) -> Tuple[float, str]:
+    """Pick the VDS rating factor (and its source) for a MOSFET technology"""
+    for guideline in vds_rating_guidelines:
+        if '0.6' in guideline:
+            return 0.6, "heuristics VDS rating factor"
+        elif '0.7' in guideline and mosfet_type.lower() == 'sic':
+            return 0.7, "heuristics VDS rating factor"
+        elif '0.8' in guideline and mosfet_type.lower() == 'sic':
+            return 0.8, "heuristics VDS rating factor"
+        elif '0.7' in guideline:
+            return 0.7, "heuristics VDS rating factor"
+    rating_factor = default_silicon if mosfet_type.lower() == 'si' else default_sic
+    return rating_factor, f"default {mosfet_type} rating factor"
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, ties kept in input order"""
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    neg_scores = -np.asarray(scores, dtype=np.float64)
+    if k >= len(neg_scores):
+        return np.argsort(neg_scores, kind='stable')
+    # Select the k-th best score in O(N), then sort only the k winners; the
+    # result matches np.argsort(-scores, kind='stable')[:k]
+    kth = np.partition(neg_scores, k - 1)[k - 1]
+    better = np.flatnonzero(neg_scores < kth)
+    tied = np.flatnonzero(neg_scores == kth)[:k - len(better)]
+    chosen = np.sort(np.concatenate([better, tied]))
+    return chosen[np.argsort(neg_scores[chosen], kind='stable')]
+
+
+def suggest_mosfets(max_voltage: float, max_current: float, frequency_hz: float = 65000, use_web_search: bool = False, top_k: int = 5) -> List[ComponentSuggestion]:
     """
     Suggest MOSFETs based on voltage and current requirements
     Now incorporates design heuristics from documents
@@ -36,6 +70,7 @@ def suggest_mosfets(max_voltage: float, max_current: float, frequency_hz: float
         max_current: Maximum current requirement (A)
         frequency_hz: Switching frequency (Hz) for improved analysis
         use_web_search: If True, search web for components instead of local database
+        top_k: Number of local-database suggestions to return
         
     Returns:
         List of MOSFET suggestions sorted by suitability with applied heuristics
@@ -43,7 +78,7 @@ def suggest_mosfets(max_voltage: float, max_current: float, frequency_hz: float
     # Handle web search mode
     if use_web_search:
         try:
-            from lib.web_component_scraper import WebComponentScraper, create_component_search_terms
+            from lib.web_component_scraper import get_web_scraper, create_component_search_terms
             
             # Create circuit parameters for search
             circuit_params = {
@@ -53,7 +88,7 @@ def suggest_mosfets(max_voltage: float, max_current: float, frequency_hz: float
             }
             
             # Search for MOSFETs with streaming UI
-            scraper = WebComponentScraper()
+            scraper = get_web_scraper()
             search_terms = create_component_search_terms(circuit_params)
             
             # Create status container for progress tracking
@@ -82,20 +117,20 @@ def suggest_mosfets(max_voltage: float, max_current: float, frequency_hz: float
                     id_rating = max(20, max_current * 2)  # At least 2x max current
                     rdson_typical = 25 if vds_rating <= 60 else 50 if vds_rating <= 100 else 100
                     
-                    mock_mosfet = type('MOSFET', (), {
-                        'name': comp.part_number,
-                        'manufacturer': comp.manufacturer,
-                        'vds': vds_rating,  # Realistic voltage rating
-                        'id': id_rating,   # Realistic current rating
-                        'rdson': rdson_typical,  # Typical RDS(on) for voltage class
-                        'qg': 25.0,  # Typical gate charge
-                        'package': comp.package or "TO-220",
-                        'typical_use': f"Web search result - {comp.description}",
-                        'efficiency_range': "90-95%",  # Typical efficiency range
-                        'price': comp.price,
-                        'availability': comp.availability,
-                        'distributor': comp.distributor
-                    })()
+                    mock_mosfet = WebMOSFET(
+                        name=comp.part_number,
+                        manufacturer=comp.manufacturer,
+                        vds=vds_rating,  # Realistic voltage rating
+                        id=id_rating,   # Realistic current rating
+                        rdson=rdson_typical,  # Typical RDS(on) for voltage class
+                        qg=25.0,  # Typical gate charge
+                        package=comp.package or "TO-220",
+                        typical_use=f"Web search result - {comp.description}",
+                        efficiency_range="90-95%",  # Typical efficiency range
+                        price=comp.price,
+                        availability=comp.availability,
+                        distributor=comp.distributor
+                    )
                     
                     suggestion = ComponentSuggestion(
                         component=mock_mosfet,
@@ -170,40 +205,33 @@ def suggest_mosfets(max_voltage: float, max_current: float, frequency_hz: float
                     applied_heuristics.append(f"🛡️ VGS protection: checking gate oxide limits")
                     break
     
-    for mosfet in MOSFET_LIBRARY:
-        mosfet_type = getattr(mosfet, 'mosfet_type', 'Si')
-        rating_factor = default_silicon_rating_factor if mosfet_type.lower() == 'si' else default_sic_rating_factor
-        rating_factor_source = f"default {mosfet_type} rating factor"
-        for guideline in extracted_vds_rating_guidelines:
-            if '0.6' in guideline:
-                rating_factor = 0.6
-                rating_factor_source = "heuristics VDS rating factor"
-                break
-            elif '0.7' in guideline and mosfet_type.lower() == 'sic':
-                rating_factor = 0.7
-                rating_factor_source = "heuristics VDS rating factor"
-                break
-            elif '0.8' in guideline and mosfet_type.lower() == 'sic':
-                rating_factor = 0.8
-                rating_factor_source = "heuristics VDS rating factor"
-                break
-            elif '0.7' in guideline:
-                rating_factor = 0.7
-                rating_factor_source = "heuristics VDS rating factor"
-                break
-
-        vin_peak = vin_max * overshoot_multiplier
+    # Resolve the VDS rating factor once per MOSFET technology, then gate the
+    # whole library on VDS and ID with column masks
+    mosfet_library = component_data.MOSFET_LIBRARY
+    mosfet_columns = component_data.get_library_columns('MOSFET_LIBRARY')
+    mosfet_types = mosfet_columns['mosfet_type']
+    rating_factors = {
+        mosfet_type: _mosfet_rating_factor(
+            mosfet_type, extracted_vds_rating_guidelines,
+            default_silicon_rating_factor, default_sic_rating_factor
+        )
+        for mosfet_type in set(mosfet_types)
+    }
+    factor_column = np.empty(len(mosfet_library))
+    for mosfet_type, (rating_factor, _) in rating_factors.items():
+        factor_column[mosfet_types == mosfet_type] = rating_factor
+    
+    vin_peak = vin_max * overshoot_multiplier
+    # We treat `max_current` as the user's computed RMS current requirement for selection.
+    computed_rms_current = max_current
+    id_filter_threshold_a = computed_rms_current * current_margin
+    gate_mask = ~(mosfet_columns['vds'] < vin_peak / factor_column) & ~(mosfet_columns['id'] < id_filter_threshold_a)
+    
+    for index in np.flatnonzero(gate_mask):
+        mosfet = mosfet_library[index]
+        rating_factor, rating_factor_source = rating_factors[mosfet_types[index]]
         required_vds = vin_peak / rating_factor
-        if mosfet.vds < required_vds:
-            continue
-        
-        # Check current requirement with margin (compare against computed RMS/current requirement).
-        # We treat `max_current` as the user's computed RMS current requirement for selection.
-        computed_rms_current = max_current
-        id_filter_threshold_a = computed_rms_current * current_margin
-        id_filter_passed = mosfet.id >= id_filter_threshold_a
-        if not id_filter_passed:
-            continue
+        id_filter_passed = True
         
         # After basic VDS and ID gating, perform comparative risk-assessment checks
         # Calculate suitability score with NEW heuristics
@@ -520,8 +548,9 @@ def suggest_mosfets(max_voltage: float, max_current: float, frequency_hz: float
             selection_details=selection_details
         ))
     
-    # Sort by score (highest first)
-    suggestions.sort(key=lambda x: x.score, reverse=True)
+    # Keep the top_k by score (highest first, ties in library order)
+    top = _top_k_indices(np.array([suggestion.score for suggestion in suggestions]), top_k)
+    suggestions = [suggestions[i] for i in top]
     
     # Add global heuristics summary to top suggestions
     for i, suggestion in enumerate(suggestions[:3]):
@@ -530,10 +559,10 @@ def suggest_mosfets(max_voltage: float, max_current: float, frequency_hz: float
                 f"📊 Analysis from: {', '.join(heuristics_analysis.get('documents_found', ['default']))}"
             ])
     
-    return suggestions[:5]  # Return top 5
+    return suggestions
 
 
-def suggest_capacitors(required_capacitance_uf: float, max_voltage: float, frequency_hz: float = 65000, use_web_search: bool = False) -> List[ComponentSuggestion]:
+def suggest_capacitors(required_capacitance_uf: float, max_voltage: float, frequency_hz: float = 65000, use_web_search: bool = False, top_k: int = 5) -> List[ComponentSuggestion]:
     """
     Suggest capacitors based on capacitance and voltage requirements
     Now incorporates design heuristics from documents
@@ -543,6 +572,7 @@ def suggest_capacitors(required_capacitance_uf: float, max_voltage: float, frequ
         max_voltage: Maximum voltage requirement (V)
         frequency_hz: Switching frequency (Hz) for improved analysis
         use_web_search: If True, search web for components instead of local database
+        top_k: Number of local-database suggestions to return
         
     Returns:
         List of capacitor suggestions sorted by suitability with applied heuristics
@@ -550,14 +580,14 @@ def suggest_capacitors(required_capacitance_uf: float, max_voltage: float, frequ
     # Handle web search mode
     if use_web_search:
         try:
-            from lib.web_component_scraper import WebComponentScraper, create_component_search_terms
+            from lib.web_component_scraper import get_web_scraper, create_component_search_terms
             
             circuit_params = {
                 'vout': max_voltage,
                 'frequency': frequency_hz
             }
             
-            scraper = WebComponentScraper()
+            scraper = get_web_scraper()
             search_terms = create_component_search_terms(circuit_params)
             
             # Create status container for progress tracking
@@ -582,19 +612,19 @@ def suggest_capacitors(required_capacitance_uf: float, max_voltage: float, frequ
                     standard_voltages = [16, 25, 35, 50, 63, 100]  # V
                     voltage_rating = min([v for v in standard_voltages if v >= max_voltage * 1.2])
                     
-                    mock_capacitor = type('Capacitor', (), {
-                        'part_number': comp.part_number,
-                        'manufacturer': comp.manufacturer,
-                        'capacitance': closest_cap,  # Use standard capacitance value
-                        'voltage': voltage_rating,  # Use standard voltage rating
-                        'type': "Ceramic/Aluminum Electrolytic",
-                        'esr': "< 100mΩ",  # Typical ESR range
-                        'primary_use': f"Web search result - {comp.description}",
-                        'temp_range': "-40°C to +105°C",  # Typical temp range
-                        'price': comp.price,
-                        'availability': comp.availability,
-                        'distributor': comp.distributor
-                    })()
+                    mock_capacitor = WebCapacitor(
+                        part_number=comp.part_number,
+                        manufacturer=comp.manufacturer,
+                        capacitance=closest_cap,  # Use standard capacitance value
+                        voltage=voltage_rating,  # Use standard voltage rating
+                        type="Ceramic/Aluminum Electrolytic",
+                        esr="< 100mΩ",  # Typical ESR range
+                        primary_use=f"Web search result - {comp.description}",
+                        temp_range="-40°C to +105°C",  # Typical temp range
+                        price=comp.price,
+                        availability=comp.availability,
+                        distributor=comp.distributor
+                    )
                     
                     suggestion = ComponentSuggestion(
                         component=mock_capacitor,
@@ -664,15 +694,17 @@ def suggest_capacitors(required_capacitance_uf: float, max_voltage: float, frequ
                         except:
                             pass
     
-    for capacitor in CAPACITOR_LIBRARY:
-        # Check voltage rating with updated margin
-        if capacitor.voltage < max_voltage * voltage_margin:
-            continue
-        
-        # Check if capacitance is suitable with updated tolerance
-        cap_ratio = capacitor.capacitance / required_capacitance_uf
-        if cap_ratio < (1/capacitance_tolerance) or cap_ratio > capacitance_tolerance:
-            continue
+    # Gate on voltage rating and capacitance window with column masks
+    capacitor_columns = component_data.get_library_columns('CAPACITOR_LIBRARY')
+    cap_ratios = capacitor_columns['capacitance'] / required_capacitance_uf
+    gate_mask = (
+        ~(capacitor_columns['voltage'] < max_voltage * voltage_margin)
+        & ~(cap_ratios < (1/capacitance_tolerance))
+        & ~(cap_ratios > capacitance_tolerance)
+    )
+    
+    for index in np.flatnonzero(gate_mask):
+        capacitor = component_data.CAPACITOR_LIBRARY[index]
         
         # Calculate suitability score with heuristics
         score = 100.0
@@ -753,8 +785,9 @@ def suggest_capacitors(required_capacitance_uf: float, max_voltage: float, frequ
             heuristics_applied=component_heuristics
         ))
     
-    # Sort by score (highest first)
-    suggestions.sort(key=lambda x: x.score, reverse=True)
+    # Keep the top_k by score (highest first, ties in library order)
+    top = _top_k_indices(np.array([suggestion.score for suggestion in suggestions]), top_k)
+    suggestions = [suggestions[i] for i in top]
     
     # Add global heuristics summary to top suggestions
     for i, suggestion in enumerate(suggestions[:3]):
@@ -763,11 +796,12 @@ def suggest_capacitors(required_capacitance_uf: float, max_voltage: float, frequ
                 f"📊 Analysis from: {', '.join(heuristics_analysis.get('documents_found', ['default']))}"
             ])
     
-    return suggestions[:5]  # Return top 5
+    return suggestions
 
 
 def suggest_input_capacitors(required_capacitance_uf: float, max_voltage: float, 
-                            ripple_current_a: float, frequency_hz: float = 65000, use_web_search: bool = False) -> List[ComponentSuggestion]:
+                            ripple_current_a: float, frequency_hz: float = 65000, use_web_search: bool = False,
+                            top_k: int = 5) -> List[ComponentSuggestion]:
     """
     Suggest input capacitors based on capacitance, voltage, and ripple current requirements
     Incorporates design heuristics from Input Capacitor Selection document
@@ -778,6 +812,7 @@ def suggest_input_capacitors(required_capacitance_uf: float, max_voltage: float,
         ripple_current_a: Estimated RMS ripple current (A)
         frequency_hz: Switching frequency (Hz) for improved analysis
         use_web_search: If True, search web for components instead of local database
+        top_k: Number of local-database suggestions to return
         
     Returns:
         List of input capacitor suggestions sorted by suitability with applied heuristics
@@ -785,14 +820,14 @@ def suggest_input_capacitors(required_capacitance_uf: float, max_voltage: float,
     # Handle web search mode
     if use_web_search:
         try:
-            from lib.web_component_scraper import WebComponentScraper, create_component_search_terms
+            from lib.web_component_scraper import get_web_scraper, create_component_search_terms
             
             circuit_params = {
                 'vin': max_voltage,
                 'frequency': frequency_hz
             }
             
-            scraper = WebComponentScraper()
+            scraper = get_web_scraper()
             search_terms = create_component_search_terms(circuit_params)
             
             # Create status container for progress tracking
@@ -808,24 +843,24 @@ def suggest_input_capacitors(required_capacitance_uf: float, max_voltage: float,
             for distributor, components in web_results.items():
                 for comp in components:
                     # Create mock InputCapacitor matching exact dataclass structure
-                    mock_input_cap = type('InputCapacitor', (), {
-                        'part_number': comp.part_number,  # Exact field names from dataclass
-                        'manufacturer': comp.manufacturer,
-                        'category': "See datasheet",  # MLCC, Polymer, Electrolytic, Film
-                        'dielectric': "See datasheet",  # X7R, X5R, etc.
-                        'capacitance': required_capacitance_uf,  # µF
-                        'voltage': max_voltage,  # V
-                        'esr': 0.1,  # mΩ - default value
-                        'esl': 1.0,  # nH - default value
-                        'ripple_rating': ripple_current_a,  # A
-                        'lifetime': 5000.0,  # hours - default value
-                        'package': comp.package or "See datasheet",
-                        'cost': 0.0,  # USD - default
-                        'availability': comp.availability,
-                        'notes': f"Web search result - {comp.description}",
-                        'price': comp.price,
-                        'distributor': comp.distributor
-                    })()
+                    mock_input_cap = WebInputCapacitor(
+                        part_number=comp.part_number,  # Exact field names from dataclass
+                        manufacturer=comp.manufacturer,
+                        category="See datasheet",  # MLCC, Polymer, Electrolytic, Film
+                        dielectric="See datasheet",  # X7R, X5R, etc.
+                        capacitance=required_capacitance_uf,  # µF
+                        voltage=max_voltage,  # V
+                        esr=0.1,  # mΩ - default value
+                        esl=1.0,  # nH - default value
+                        ripple_rating=ripple_current_a,  # A
+                        lifetime=5000.0,  # hours - default value
+                        package=comp.package or "See datasheet",
+                        cost=0.0,  # USD - default
+                        availability=comp.availability,
+                        notes=f"Web search result - {comp.description}",
+                        price=comp.price,
+                        distributor=comp.distributor
+                    )
                     
                     suggestion = ComponentSuggestion(
                         component=mock_input_cap,
@@ -857,15 +892,17 @@ def suggest_input_capacitors(required_capacitance_uf: float, max_voltage: float,
     voltage_margin = 1.5  # Default 50% voltage derating
     capacitance_tolerance = 3.0  # Allow wider range for input capacitors
     
-    for capacitor in INPUT_CAPACITOR_LIBRARY:
-        # Check voltage rating with margin
-        if capacitor.voltage < max_voltage * voltage_margin:
-            continue
-        
-        # Check if capacitance is in reasonable range
-        cap_ratio = capacitor.capacitance / required_capacitance_uf
-        if cap_ratio < (1/capacitance_tolerance) or cap_ratio > capacitance_tolerance:
-            continue
+    # Gate on voltage rating and capacitance window with column masks
+    capacitor_columns = component_data.get_library_columns('INPUT_CAPACITOR_LIBRARY')
+    cap_ratios = capacitor_columns['capacitance'] / required_capacitance_uf
+    gate_mask = (
+        ~(capacitor_columns['voltage'] < max_voltage * voltage_margin)
+        & ~(cap_ratios < (1/capacitance_tolerance))
+        & ~(cap_ratios > capacitance_tolerance)
+    )
+    
+    for index in np.flatnonzero(gate_mask):
+        capacitor = component_data.INPUT_CAPACITOR_LIBRARY[index]
         
         # Calculate base suitability score
         score = 100.0
@@ -929,8 +966,9 @@ def suggest_input_capacitors(required_capacitance_uf: float, max_voltage: float,
             heuristics_applied=component_heuristics
         ))
     
-    # Sort by score (highest first)
-    suggestions.sort(key=lambda x: x.score, reverse=True)
+    # Keep the top_k by score (highest first, ties in library order)
+    top = _top_k_indices(np.array([suggestion.score for suggestion in suggestions]), top_k)
+    suggestions = [suggestions[i] for i in top]
     
     # Add global heuristics summary to top suggestions
     for i, suggestion in enumerate(suggestions[:3]):
@@ -939,10 +977,10 @@ def suggest_input_capacitors(required_capacitance_uf: float, max_voltage: float,
                 f"📊 Input capacitor design heuristics applied"
             ])
     
-    return suggestions[:5]  # Return top 5
+    return suggestions
 
 
-def suggest_inductors(required_inductance_uh: float, max_current: float, frequency_hz: float = 65000, use_web_search: bool = False) -> List[ComponentSuggestion]:
+def suggest_inductors(required_inductance_uh: float, max_current: float, frequency_hz: float = 65000, use_web_search: bool = False, top_k: int = 5) -> List[ComponentSuggestion]:
     """
     Suggest inductors based on inductance and current requirements
     Now incorporates design heuristics from documents
@@ -952,6 +990,7 @@ def suggest_inductors(required_inductance_uh: float, max_current: float, frequen
         max_current: Maximum current requirement (A)
         frequency_hz: Switching frequency (Hz) for improved analysis
         use_web_search: If True, search web for components instead of local database
+        top_k: Number of local-database suggestions to return
         
     Returns:
         List of inductor suggestions sorted by suitability with applied heuristics
@@ -959,7 +998,7 @@ def suggest_inductors(required_inductance_uh: float, max_current: float, frequen
     # Handle web search mode
     if use_web_search:
         try:
-            from lib.web_component_scraper import WebComponentScraper, create_component_search_terms
+            from lib.web_component_scraper import get_web_scraper, create_component_search_terms
             
             circuit_params = {
                 'vin': 12,  # Default assumption for search
@@ -968,7 +1007,7 @@ def suggest_inductors(required_inductance_uh: float, max_current: float, frequen
                 'frequency': frequency_hz
             }
             
-            scraper = WebComponentScraper()
+            scraper = get_web_scraper()
             search_terms = create_component_search_terms(circuit_params)
             
             # Create status container for progress tracking
@@ -984,21 +1023,21 @@ def suggest_inductors(required_inductance_uh: float, max_current: float, frequen
             for distributor, components in web_results.items():
                 for comp in components:
                     # Create mock Inductor matching exact dataclass structure
-                    mock_inductor = type('Inductor', (), {
-                        'part_number': comp.part_number,  # Exact field names from dataclass
-                        'manufacturer': comp.manufacturer,
-                        'inductance': required_inductance_uh,  # µH
-                        'current': max_current,  # A
-                        'dcr': 0.1,  # mΩ (DC Resistance) - default value
-                        'sat_current': max_current * 1.2,  # A - slightly higher than operating current
-                        'package': comp.package or "See datasheet",
-                        'shielded': False,  # Default value
-                        'core_material': "See datasheet",  # Default value
-                        'temp_range': "See datasheet",  # Default value
-                        'price': comp.price,
-                        'availability': comp.availability,
-                        'distributor': comp.distributor
-                    })()
+                    mock_inductor = WebInductor(
+                        part_number=comp.part_number,  # Exact field names from dataclass
+                        manufacturer=comp.manufacturer,
+                        inductance=required_inductance_uh,  # µH
+                        current=max_current,  # A
+                        dcr=0.1,  # mΩ (DC Resistance) - default value
+                        sat_current=max_current * 1.2,  # A - slightly higher than operating current
+                        package=comp.package or "See datasheet",
+                        shielded=False,  # Default value
+                        core_material="See datasheet",  # Default value
+                        temp_range="See datasheet",  # Default value
+                        price=comp.price,
+                        availability=comp.availability,
+                        distributor=comp.distributor
+                    )
                     
                     suggestion = ComponentSuggestion(
                         component=mock_inductor,
@@ -1070,68 +1109,75 @@ def suggest_inductors(required_inductance_uh: float, max_current: float, frequen
     
     # Debug: Log the filtering process
     debug_log = []
-    debug_log.append(f"🔍 Starting inductor search: {len(INDUCTOR_LIBRARY)} total inductors")
+    debug_log.append(f"🔍 Starting inductor search: {len(component_data.INDUCTOR_LIBRARY)} total inductors")
     debug_log.append(f"🎯 Requirements: {required_inductance_uh:.1f}µH, {max_current:.2f}A max, {frequency_hz/1000:.0f}kHz")
     debug_log.append(f"📏 Margins: current={current_margin:.1f}x, inductance_tolerance={inductance_tolerance:.1f}")
     
-    for inductor in INDUCTOR_LIBRARY:
-        debug_info = f"Checking {inductor.part_number}: {inductor.inductance}µH, {inductor.current}A, Isat={inductor.sat_current}A"
-        
-        # Check current rating with updated margin
-        required_current = max_current * current_margin
-        if inductor.current < required_current:
-            debug_log.append(f"❌ {debug_info} - Current too low ({inductor.current}A < {required_current:.2f}A)")
-            continue
-        if inductor.sat_current < max_current * current_margin:
-            debug_log.append(f"❌ {debug_info} - Saturation current too low ({inductor.sat_current}A < {max_current * current_margin * 1.2:.2f}A)")
-            continue
-        
-        # Check if inductance is suitable with updated tolerance
-        ind_ratio = inductor.inductance / required_inductance_uh
-        min_acceptable = 1 - inductance_tolerance
-        max_acceptable = 1 + inductance_tolerance
-        if ind_ratio < min_acceptable or ind_ratio > max_acceptable:
-            debug_log.append(f"❌ {debug_info} - Inductance mismatch (ratio {ind_ratio:.2f}, need {min_acceptable:.2f}-{max_acceptable:.2f})")
-            continue
-        
-        debug_log.append(f"✅ {debug_info} - PASSED all filters")
-        
-        # Calculate suitability score with heuristics
-        score = 100.0
+    # Gate on current, saturation current and inductance window with column masks
+    inductor_library = component_data.INDUCTOR_LIBRARY
+    inductor_columns = component_data.get_library_columns('INDUCTOR_LIBRARY')
+    required_current = max_current * current_margin
+    min_acceptable = 1 - inductance_tolerance
+    max_acceptable = 1 + inductance_tolerance
+    ind_ratios = inductor_columns['inductance'] / required_inductance_uh
+    
+    current_ok = ~(inductor_columns['current'] < required_current)
+    sat_current_ok = ~(inductor_columns['sat_current'] < required_current)
+    inductance_ok = ~(ind_ratios < min_acceptable) & ~(ind_ratios > max_acceptable)
+    gate_mask = current_ok & sat_current_ok & inductance_ok
+    
+    debug_log.append(f"❌ {int((~current_ok).sum())} rejected - current below {required_current:.2f}A")
+    debug_log.append(f"❌ {int((current_ok & ~sat_current_ok).sum())} rejected - saturation current below {required_current:.2f}A")
+    debug_log.append(f"❌ {int((current_ok & sat_current_ok & ~inductance_ok).sum())} rejected - inductance outside {min_acceptable:.2f}-{max_acceptable:.2f}x")
+    debug_log.append(f"✅ {int(gate_mask.sum())} passed all filters")
+    
+    # Score every candidate at once; library-intrinsic terms (DCR, SMD package,
+    # manufacturer) come from precomputed columns, only the query terms are new
+    candidates = np.flatnonzero(gate_mask)
+    high_frequency = frequency_hz > 100000
+    inductance = inductor_columns['inductance'][candidates]
+    current_ratios = inductor_columns['current'][candidates] / (max_current * current_margin)
+    optimal_current = (current_ratios >= 1.2) & (current_ratios <= 1.8)
+    
+    # Prefer inductance close to required value
+    scores = 100.0 - np.abs(inductance - required_inductance_uh) / required_inductance_uh * 50
+    
+    # DCR penalty with frequency consideration (high DCR hurts more at high frequency)
+    dcr_penalty = inductor_columns['dcr'][candidates] * 0.01
+    if high_frequency:
+        dcr_penalty = dcr_penalty * 1.5
+    scores = scores - dcr_penalty
+    
+    # Current utilization optimization (sweet spot 1.2-1.8x)
+    scores = np.where(current_ratios > 2, scores - (current_ratios - 2) * 10, scores)
+    scores = np.where(optimal_current, scores + 5, scores)
+    
+    # Core material bonus based on heuristics: +10 per document recommending the manufacturer
+    manufacturer_docs = np.zeros(len(candidates))
+    if heuristics_analysis and heuristics_analysis['selection_criteria']:
+        candidate_mfrs = inductor_columns['manufacturer_lower'][candidates]
+        for doc_criteria in heuristics_analysis['selection_criteria'].values():
+            guidelines = [g.lower() for g in doc_criteria.get('core_material_recommendations', [])]
+            recommended = {mfr for mfr in set(candidate_mfrs) if any(mfr in g for g in guidelines)}
+            doc_hits = np.array([mfr in recommended for mfr in candidate_mfrs], dtype=bool)
+            scores = np.where(doc_hits, scores + 10, scores)
+            manufacturer_docs += doc_hits
+    
+    # Package preference based on frequency
+    smd_bonus = inductor_columns['smd_package'][candidates] & high_frequency
+    scores = np.where(smd_bonus, scores + 5, scores)
+    
+    # Only the top_k (by score, ties in library order) need reasons and heuristics
+    for rank in _top_k_indices(scores, top_k):
+        inductor = inductor_library[candidates[rank]]
+        current_ratio = current_ratios[rank]
         component_heuristics = applied_heuristics.copy()
-        
-        # Prefer inductance close to required value
-        ind_diff = abs(inductor.inductance - required_inductance_uh) / required_inductance_uh
-        score -= ind_diff * 50
-        
-        # DCR penalty with frequency consideration
-        dcr_penalty = inductor.dcr * 0.01
-        if frequency_hz > 100000:  # High frequency applications
-            dcr_penalty *= 1.5  # Penalize high DCR more at high frequencies
+        if high_frequency:
             component_heuristics.append("🔄 High-frequency DCR penalty applied")
-        score -= dcr_penalty
-        
-        # Current utilization optimization
-        current_ratio = inductor.current / (max_current * current_margin)
-        if current_ratio > 2:
-            score -= (current_ratio - 2) * 10
-        elif 1.2 <= current_ratio <= 1.8:  # Sweet spot for utilization
-            score += 5
+        if optimal_current[rank]:
             component_heuristics.append("⚡ Optimal current utilization")
-        
-        # Core material bonus based on heuristics
-        if heuristics_analysis and heuristics_analysis['selection_criteria']:
-            for doc_criteria in heuristics_analysis['selection_criteria'].values():
-                for guideline in doc_criteria.get('core_material_recommendations', []):
-                    # Check if this inductor's manufacturer/type is mentioned favorably
-                    if inductor.manufacturer.lower() in guideline.lower():
-                        score += 10
-                        component_heuristics.append(f"🎯 Recommended manufacturer from heuristics")
-                        break
-        
-        # Package preference based on frequency
-        if frequency_hz > 100000 and 'SO' in inductor.package.upper():
-            score += 5
+        component_heuristics.extend(["🎯 Recommended manufacturer from heuristics"] * int(manufacturer_docs[rank]))
+        if smd_bonus[rank]:
             component_heuristics.append("📦 SMD package suitable for high frequency")
         
         # Build comprehensive reason string
@@ -1148,13 +1194,10 @@ def suggest_inductors(required_inductance_uh: float, max_current: float, frequen
         suggestions.append(ComponentSuggestion(
             component=inductor,
             reason=reason,
-            score=score,
+            score=float(scores[rank]),
             heuristics_applied=component_heuristics
         ))
     
-    # Sort by score (highest first)
-    suggestions.sort(key=lambda x: x.score, reverse=True)
-    
     # Add global heuristics summary to top suggestions
     for i, suggestion in enumerate(suggestions[:3]):
         if applied_heuristics and i == 0:  # Add to top suggestion
@@ -1162,4 +1205,5 @@ def suggest_inductors(required_inductance_uh: float, max_current: float, frequen
                 f"📊 Analysis from: {', '.join(heuristics_analysis.get('documents_found', ['default']))}"
             ])
     
-    return suggestions[:5]  # Return top 5
+    return suggestions
+
@@ -6,6 +6,8 @@ Orchestrates the complete simulation workflow from component calculation to resu
 import streamlit as st
 from typing import Dict, Any, Optional, Tuple
 import numpy as np
+import pandas as pd
+import json
 import sys
 import os
 import subprocess
@@ -52,6 +54,57 @@ PLOTLY_AVAILABLE, go, make_subplots, plotly_error = check_plotly_availability()
 from .ltspice_interface import get_simulator
 from .netlist_generator import create_buck_simulation
 
+# Maximum points per waveform trace sent to the browser
+PLOT_MAX_POINTS = 2000
+
+def downsample_lttb(x, y, n_out: int = PLOT_MAX_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a waveform with Largest-Triangle-Three-Buckets (LTTB)
+
+    Keeps the first and last samples and, for each bucket in between, the sample
+    forming the largest triangle with the previously kept point and the average
+    of the next bucket. Peaks and switching edges survive the reduction.
+
+    Args:
+        x: Sample positions (monotonic)
+        y: Sample values
+        n_out: Number of points to keep
+
+    Returns:
+        Tuple of downsampled (x, y) arrays
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # n_out - 2 buckets spanning the interior samples
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+
+    return x[keep], y[keep]
+
 def validate_simulation_inputs(circuit_params: Dict[str, float], calculated_components: Dict[str, float]) -> Dict[str, Any]:
     """
     Validate simulation inputs before running
@@ -81,6 +134,55 @@ def validate_simulation_inputs(circuit_params: Dict[str, float], calculated_comp
     except Exception as e:
         return {'valid': False, 'error': f'Validation error: {str(e)}'}
 
+def save_simulation_results(results: Dict[str, Any], waveform_path: str, meta_path: str) -> None:
+    """
+    Write a successful simulation result to disk for later reuse
+    
+    Waveforms go to a Parquet file (one column per trace); netlist, analysis
+    and trace names go to a JSON sidecar.
+    """
+    raw_results = results['raw_results']
+    columns = {'time': np.asarray(raw_results['time'], dtype=np.float64)}
+    for group in ('voltages', 'currents'):
+        for name, values in raw_results[group].items():
+            columns[name] = np.asarray(values, dtype=np.float64)
+    pd.DataFrame(columns).to_parquet(waveform_path, index=False)
+    
+    meta = {
+        'netlist': results['netlist'],
+        'analysis': results['analysis'],
+        'simulator_type': results.get('simulator_type', 'Unknown'),
+        'voltages': list(raw_results['voltages']),
+        'currents': list(raw_results['currents']),
+        'analysis_type': raw_results.get('analysis_type', 'transient'),
+    }
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+def load_simulation_results(waveform_path: str, meta_path: str) -> Dict[str, Any]:
+    """
+    Load a result written by save_simulation_results
+    
+    Returns:
+        Results dictionary in the same shape as SimulationService.run_buck_simulation
+    """
+    waveforms = pd.read_parquet(waveform_path)
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    
+    return {
+        'success': True,
+        'netlist': meta['netlist'],
+        'raw_results': {
+            'time': waveforms['time'].to_numpy(),
+            'voltages': {name: waveforms[name].to_numpy() for name in meta['voltages']},
+            'currents': {name: waveforms[name].to_numpy() for name in meta['currents']},
+            'analysis_type': meta['analysis_type'],
+        },
+        'analysis': meta['analysis'],
+        'simulator_type': meta['simulator_type'],
+    }
+
 class SimulationService:
     """
     Main service for handling circuit simulations
@@ -132,7 +234,7 @@ class SimulationService:
                     'netlist': netlist,
                     'raw_results': sim_results['results'],
                     'analysis': analysis,
-                    'simulator_type': getattr(self.simulator, '__class__.__name__', 'Unknown')
+                    'simulator_type': type(self.simulator).__name__
                 }
             else:
                 return {
@@ -157,27 +259,31 @@ class SimulationService:
         """
         
         try:
-            time = np.array(results['time'])
-            v_out = np.array(results['voltages']['V(out)'])
-            i_inductor = np.array(results['currents']['I(L1)'])
+            time = np.asarray(results['time'], dtype=np.float64)
+            v_out = np.asarray(results['voltages']['V(out)'], dtype=np.float64)
+            i_inductor = np.asarray(results['currents']['I(L1)'], dtype=np.float64)
             
             # Find steady-state region (last 50% of simulation)
             steady_start = len(time) // 2
             v_out_steady = v_out[steady_start:]
             i_inductor_steady = i_inductor[steady_start:]
             
+            # Reduce each steady-state trace once
+            v_avg, v_max, v_min = float(v_out_steady.mean()), float(v_out_steady.max()), float(v_out_steady.min())
+            i_avg, i_max, i_min = float(i_inductor_steady.mean()), float(i_inductor_steady.max()), float(i_inductor_steady.min())
+            
             # Calculate key metrics
             analysis = {
                 'output_voltage': {
-                    'average': np.mean(v_out_steady),
-                    'ripple_pk_pk': np.max(v_out_steady) - np.min(v_out_steady),
-                    'ripple_percent': (np.max(v_out_steady) - np.min(v_out_steady)) / np.mean(v_out_steady) * 100,
+                    'average': v_avg,
+                    'ripple_pk_pk': v_max - v_min,
+                    'ripple_percent': (v_max - v_min) / v_avg * 100,
                     'target': circuit_params['output_voltage']
                 },
                 'inductor_current': {
-                    'average': np.mean(i_inductor_steady),
-                    'ripple_pk_pk': np.max(i_inductor_steady) - np.min(i_inductor_steady),
-                    'peak': np.max(i_inductor_steady),
+                    'average': i_avg,
+                    'ripple_pk_pk': i_max - i_min,
+                    'peak': i_max,
                     'target': circuit_params['load_current']
                 },
                 'performance': {},
@@ -209,16 +315,13 @@ class SimulationService:
         try:
             tolerance = 0.02 * target  # 2% tolerance
             
-            # Find where voltage first enters the tolerance band
-            within_tolerance = np.abs(voltage - target) <= tolerance
+            # Settled from the sample after the last one outside the 2% band
+            outside = np.flatnonzero(np.abs(voltage - target) > tolerance)
             
-            # Find last time it was outside tolerance
-            outside_indices = np.where(~within_tolerance)[0]
-            
-            if len(outside_indices) > 0:
-                settling_index = outside_indices[-1] + 1
+            if len(outside) > 0:
+                settling_index = int(outside[-1]) + 1
                 if settling_index < len(time):
-                    return time[settling_index] * 1000  # Return in ms
+                    return float(time[settling_index]) * 1000  # Return in ms
             
             return 0.0  # Already settled or no settling detectable
             
@@ -308,6 +411,11 @@ def create_simulation_plots_v2(results: Dict[str, Any]) -> Any:
     st.success("✅ Plotly loaded successfully - Interactive charts available!")
     time_ms = np.array(raw_results['time']) * 1000  # Convert to ms
     
+    # Downsample each waveform before it is serialized to the browser
+    t_vout, v_out = downsample_lttb(time_ms, raw_results['voltages']['V(out)'])
+    t_il, i_l = downsample_lttb(time_ms, raw_results['currents']['I(L1)'])
+    t_sw, v_sw = downsample_lttb(time_ms, raw_results['voltages']['V(sw)'])
+    
     # Create subplots
     fig = make_subplots_runtime(
         rows=3, cols=1,
@@ -318,9 +426,9 @@ def create_simulation_plots_v2(results: Dict[str, Any]) -> Any:
     
     # Output voltage plot
     fig.add_trace(
-        go_runtime.Scatter(
-            x=time_ms,
-            y=raw_results['voltages']['V(out)'],
+        go_runtime.Scattergl(
+            x=t_vout,
+            y=v_out,
             name='Output Voltage',
             line=dict(color='blue', width=2)
         ),
@@ -340,9 +448,9 @@ def create_simulation_plots_v2(results: Dict[str, Any]) -> Any:
     
     # Inductor current plot
     fig.add_trace(
-        go_runtime.Scatter(
-            x=time_ms,
-            y=raw_results['currents']['I(L1)'],
+        go_runtime.Scattergl(
+            x=t_il,
+            y=i_l,
             name='Inductor Current',
             line=dict(color='green', width=2)
         ),
@@ -351,9 +459,9 @@ def create_simulation_plots_v2(results: Dict[str, Any]) -> Any:
     
     # Switch voltage plot
     fig.add_trace(
-        go_runtime.Scatter(
-            x=time_ms,
-            y=raw_results['voltages']['V(sw)'],
+        go_runtime.Scattergl(
+            x=t_sw,
+            y=v_sw,
             name='Switch Voltage',
             line=dict(color='orange', width=2)
         ),
@@ -374,6 +482,8 @@ def create_simulation_plots_v2(results: Dict[str, Any]) -> Any:
     
     return fig
 
+create_simulation_plots = create_simulation_plots_v2
+
 # Streamlit UI integration functions
 def show_simulation_button(circuit_params: Dict[str, float], 
                           calculated_components: Dict[str, float]) -> bool:
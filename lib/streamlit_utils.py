@@ -0,0 +1,32 @@
+"""
+Streamlit helpers shared by the pages, test scripts and library modules
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# st.fragment needs Streamlit 1.37+; older versions just rerun the whole page
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+def script_thread_pool(max_workers: int = None) -> ThreadPoolExecutor:
+    """
+    ThreadPoolExecutor whose worker threads share the calling script run's context
+
+    Streamlit silently drops st.* calls made from threads without a ScriptRunContext,
+    so warnings, errors and status placeholders raised by submitted work (e.g. the
+    suggest_* functions in web mode) would otherwise never render. Outside a script
+    run there is no context to share and the workers behave like plain threads.
+
+    Args:
+        max_workers: Maximum number of worker threads
+
+    Returns:
+        ThreadPoolExecutor to use as a context manager like the standard one
+    """
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx()),
+    )
@@ -3,24 +3,60 @@ Web Component Scraper for Mouser and Digikey
 Advanced implementation with working scrapers for both distributors
 """
 
+import threading
 import time
 import json
 import re
 import random
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from urllib.parse import quote_plus
 import streamlit as st
+from lib.streamlit_utils import script_thread_pool
 
 # Web scraping imports (with fallback)
 try:
     import requests
     from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
     WEB_SCRAPING_AVAILABLE = True
 except ImportError:
     WEB_SCRAPING_AVAILABLE = False
 
-@dataclass
+# Distributor search results change slowly; keep cached responses for 24 hours
+SEARCH_CACHE_TTL = 24 * 60 * 60
+
+def create_pooled_session():
+    """requests.Session with a connection pool sized for repeated distributor searches.
+
+    When requests-cache is installed, successful search pages are also cached
+    on disk for a day so repeated queries skip the network entirely.
+    """
+    try:
+        import requests_cache
+        session = requests_cache.CachedSession(
+            'web_component_cache',
+            backend='sqlite',
+            expire_after=SEARCH_CACHE_TTL,
+            allowable_methods=('GET',)
+        )
+    except ImportError:
+        session = requests.Session()
+    # No adapter-level retries: WebComponentScraper._make_request_with_retry owns the
+    # retry policy, and stacking both would multiply the attempts per search
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=25,
+        max_retries=0
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# One session for every scraper instance, so TCP/TLS connections are reused across searches
+SHARED_SESSION = create_pooled_session() if WEB_SCRAPING_AVAILABLE else None
+
+@dataclass(frozen=True)
 class WebComponent:
     """Represents a component found via web search"""
     part_number: str
@@ -31,20 +67,98 @@ class WebComponent:
     datasheet_url: Optional[str] = None
     distributor: str = ""
     package: Optional[str] = None
-    specifications: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.specifications is None:
-            self.specifications = {}
+    specifications: Dict[str, Any] = field(default_factory=dict)
+
+# Static distributor fallbacks, shown when a live search fails; built once at import
+_MOUSER_FALLBACK_DATA = {
+    'mosfet': [
+        {'part': 'IRF540NPBF', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 100V 33A TO-220AB', 'price': '$1.85'},
+        {'part': 'IRLB8721PBF', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 30V 62A TO-220AB', 'price': '$2.45'},
+        {'part': 'STP36NF06L', 'mfg': 'STMicroelectronics', 'desc': 'MOSFET N-CH 60V 30A TO-220', 'price': '$1.92'},
+        {'part': 'FQP30N06L', 'mfg': 'ON Semiconductor', 'desc': 'MOSFET N-CH 60V 32A TO-220', 'price': '$2.15'},
+        {'part': 'IRFZ44NPBF', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 55V 49A TO-220AB', 'price': '$1.68'}
+    ],
+    'capacitor': [
+        {'part': 'EEU-FR1V101', 'mfg': 'Panasonic', 'desc': 'CAP ALUM 100UF 20% 35V RADIAL', 'price': '$0.84'},
+        {'part': 'UVR1V101MPD', 'mfg': 'Nichicon', 'desc': 'CAP ALUM 100UF 20% 35V RADIAL', 'price': '$0.91'},
+        {'part': '25SVP47M', 'mfg': 'Rubycon', 'desc': 'CAP ALUM 47UF 20% 25V RADIAL', 'price': '$0.52'},
+        {'part': 'ECA-1VHG221', 'mfg': 'Panasonic', 'desc': 'CAP ALUM 220UF 20% 35V RADIAL', 'price': '$1.25'},
+        {'part': 'URS1E221MPD', 'mfg': 'Nichicon', 'desc': 'CAP ALUM 220UF 20% 25V RADIAL', 'price': '$1.18'}
+    ],
+    'inductor': [
+        {'part': 'SRR1260-220M', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 22UH 2.3A 65 MOHM', 'price': '$1.89'},
+        {'part': 'SRN6045-100M', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 10UH 4.5A 23 MOHM', 'price': '$1.45'},
+        {'part': 'CDRH104R-470MC', 'mfg': 'Sumida', 'desc': 'FIXED IND 47UH 1.8A 160 MOHM', 'price': '$2.34'},
+        {'part': 'SRR1005-100M', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 10UH 0.9A 290 MOHM', 'price': '$0.95'},
+        {'part': 'CDRH125-220M', 'mfg': 'Sumida', 'desc': 'FIXED IND 22UH 2.8A 75 MOHM', 'price': '$2.12'}
+    ]
+}
+
+_DIGIKEY_FALLBACK_DATA = {
+    'mosfet': [
+        {'part': 'IRLB8721PBF-ND', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 30V 62A TO-220AB', 'price': '$2.52', 'stock': '2,456'},
+        {'part': 'IRF540NPBF-ND', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 100V 33A TO-220AB', 'price': '$1.91', 'stock': '1,823'},
+        {'part': 'STP36NF06L-ND', 'mfg': 'STMicroelectronics', 'desc': 'MOSFET N-CH 60V 30A TO-220', 'price': '$1.98', 'stock': '3,145'},
+        {'part': 'FQP30N06L-ND', 'mfg': 'ON Semiconductor', 'desc': 'MOSFET N-CH 60V 32A TO-220', 'price': '$2.22', 'stock': '987'},
+        {'part': 'IRFZ44NPBF-ND', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 55V 49A TO-220AB', 'price': '$1.74', 'stock': '1,567'}
+    ],
+    'capacitor': [
+        {'part': 'P5555-ND', 'mfg': 'Panasonic', 'desc': 'CAP ALUM 100UF 20% 35V RADIAL', 'price': '$0.87', 'stock': '4,532'},
+        {'part': '493-1795-ND', 'mfg': 'Nichicon', 'desc': 'CAP ALUM 100UF 20% 35V RADIAL', 'price': '$0.94', 'stock': '2,876'},
+        {'part': '1189-1583-ND', 'mfg': 'Rubycon', 'desc': 'CAP ALUM 47UF 20% 25V RADIAL', 'price': '$0.55', 'stock': '6,234'},
+        {'part': 'P966-ND', 'mfg': 'Panasonic', 'desc': 'CAP ALUM 220UF 20% 35V RADIAL', 'price': '$1.29', 'stock': '1,987'},
+        {'part': '493-2105-ND', 'mfg': 'Nichicon', 'desc': 'CAP ALUM 220UF 20% 25V RADIAL', 'price': '$1.21', 'stock': '3,456'}
+    ],
+    'inductor': [
+        {'part': 'SRR1260-220MCT-ND', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 22UH 2.3A 65MOHM SMD', 'price': '$1.95', 'stock': '1,234'},
+        {'part': 'SRN6045-100MCT-ND', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 10UH 4.5A 23MOHM SMD', 'price': '$1.50', 'stock': '2,567'},
+        {'part': 'CDRH104R-470MC-ND', 'mfg': 'Sumida', 'desc': 'FIXED IND 47UH 1.8A 160MOHM SMD', 'price': '$2.42', 'stock': '876'},
+        {'part': 'SRR1005-100MCT-ND', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 10UH 0.9A 290MOHM SMD', 'price': '$0.98', 'stock': '4,321'},
+        {'part': 'CDRH125-220MC-ND', 'mfg': 'Sumida', 'desc': 'FIXED IND 22UH 2.8A 75MOHM SMD', 'price': '$2.19', 'stock': '1,543'}
+    ]
+}
+
+_MOUSER_FALLBACKS = {
+    comp_type: tuple(
+        WebComponent(
+            part_number=part_info['part'],
+            manufacturer=part_info['mfg'],
+            description=part_info['desc'],
+            price=part_info['price'],
+            availability='In Stock',
+            distributor='Mouser'
+        )
+        for part_info in parts_data
+    )
+    for comp_type, parts_data in _MOUSER_FALLBACK_DATA.items()
+}
+
+_DIGIKEY_FALLBACKS = {
+    comp_type: tuple(
+        WebComponent(
+            part_number=part_info['part'],
+            manufacturer=part_info['mfg'],
+            description=part_info['desc'],
+            price=part_info['price'],
+            availability=f"In Stock ({part_info['stock']} available)",
+            distributor='Digikey'
+        )
+        for part_info in parts_data
+    )
+    for comp_type, parts_data in _DIGIKEY_FALLBACK_DATA.items()
+}
 
 class WebComponentScraper:
     """Advanced scraper class for component distributors with working implementations"""
     
     def __init__(self):
-        self.session = requests.Session() if WEB_SCRAPING_AVAILABLE else None
+        self.session = SHARED_SESSION
         self.last_request_time = 0
         self.min_request_interval = 3.0  # 3 seconds between requests
+        self._rate_lock = threading.Lock()  # Searches may run on several threads
         self.max_retries = 3  # Maximum retry attempts
+        self.timeout = (3.05, 10.0)  # (connect, read) seconds, enforced by urllib3 on the socket
+        self.search_timeout = 20.0  # Overall seconds allowed per distributor search, retries included
         
         # Rotate user agents to avoid blocking
         self.user_agents = [
@@ -53,49 +167,68 @@ class WebComponentScraper:
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         ]
         
-        self.setup_session()
+        # The session is shared between scrapers and threads, so headers are sent
+        # per request rather than set on it
+        self.headers = self._request_headers()
     
-    def setup_session(self):
-        """Setup session with rotating headers"""
-        if not self.session:
-            return
-            
+    def _request_headers(self) -> Dict[str, str]:
+        """Browser-like request headers with a randomly rotated user agent"""
         user_agent = random.choice(self.user_agents)
         
-        self.session.headers.update({
+        return {
             'User-Agent': user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
             'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'max-age=0',
             'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120"',
             'sec-ch-ua-mobile': '?0',
             'sec-ch-ua-platform': '"Windows"',
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
             'Sec-Fetch-Site': 'none'
-        })
+        }
     
     def _rate_limit(self):
-        """Ensure we don't make requests too quickly"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        """Ensure we don't make requests too quickly, even from concurrent searches"""
+        # Reserve the next request slot under the lock, then sleep outside it so
+        # concurrent callers queue up min_request_interval apart
+        with self._rate_lock:
+            current_time = time.time()
+            request_time = max(current_time, self.last_request_time + self.min_request_interval)
+            self.last_request_time = request_time
+        if request_time > current_time:
+            time.sleep(request_time - current_time)
     
-    def _make_request_with_retry(self, url, timeout=15):
-        """Make HTTP request with retry logic for rate limiting"""
+    def _can_retry(self, attempt, deadline=None):
+        """Whether another attempt is allowed: retries remain and the search deadline hasn't passed"""
+        return attempt < self.max_retries and (deadline is None or time.time() < deadline)
+    
+    def _cached_response(self, url):
+        """Unexpired response for url from the requests-cache store, or None on a miss / without a cache"""
+        cache = getattr(self.session, 'cache', None)
+        if cache is None:
+            return None
+        request = self.session.prepare_request(requests.Request('GET', url, headers=self.headers))
+        response = cache.get_response(cache.create_key(request))
+        return response if response is not None and not response.is_expired else None
+    
+    def _make_request_with_retry(self, url, timeout=None, deadline=None):
+        """Make HTTP request with retry logic for rate limiting; raises requests Timeout if every attempt times out"""
+        # Cache hits never reach the distributor, so they skip the rate-limit interval
+        cached = self._cached_response(url)
+        if cached is not None:
+            return cached
+        
+        timeout = timeout or self.timeout
         for attempt in range(self.max_retries + 1):
             try:
                 self._rate_limit()
-                response = self.session.get(url, timeout=timeout)
+                response = self.session.get(url, headers=self.headers, timeout=timeout)
                 
                 if response.status_code == 429:  # Too Many Requests
-                    if attempt < self.max_retries:
+                    if self._can_retry(attempt, deadline):
                         wait_time = (attempt + 1) * 5  # Exponential backoff: 5s, 10s
                         st.warning(f"Rate limited by server. Waiting {wait_time} seconds before retry {attempt + 1}/{self.max_retries}...")
                         time.sleep(wait_time)
@@ -107,15 +240,15 @@ class WebComponentScraper:
                 return response
                 
             except requests.exceptions.Timeout:
-                if attempt < self.max_retries:
+                if self._can_retry(attempt, deadline):
                     st.warning(f"Request timeout. Retrying {attempt + 1}/{self.max_retries}...")
                     time.sleep(2)
                     continue
                 else:
-                    raise Exception("Request timed out after retries")
+                    raise
             
             except requests.exceptions.RequestException as e:
-                if attempt < self.max_retries:
+                if self._can_retry(attempt, deadline):
                     st.warning(f"Request failed: {e}. Retrying {attempt + 1}/{self.max_retries}...")
                     time.sleep(2)
                     continue
@@ -124,13 +257,16 @@ class WebComponentScraper:
         
         raise Exception("Max retries exceeded")
     
-    def search_mouser(self, search_term: str, component_type: str) -> List[WebComponent]:
+    def search_mouser(self, search_term: str, component_type: str, timeout=None,
+                      deadline=None) -> List[WebComponent]:
         """
         Advanced Mouser.com search with working implementation
         
         Args:
             search_term: Component search term (e.g., "MOSFET N-Channel 100V")
             component_type: Type of component ("mosfet", "capacitor", "inductor")
+            timeout: (connect, read) timeout in seconds, defaults to self.timeout
+            deadline: time.time() value after which no further retries are started
         
         Returns:
             List of WebComponent objects
@@ -150,7 +286,7 @@ class WebComponentScraper:
             base_url = category_urls.get(component_type, 'https://www.mouser.com/c/')
             search_url = f"{base_url}?q={quote_plus(search_term)}"
             
-            response = self._make_request_with_retry(search_url)
+            response = self._make_request_with_retry(search_url, timeout=timeout, deadline=deadline)
             soup = BeautifulSoup(response.content, 'html.parser')
             components = []
             
@@ -186,16 +322,19 @@ class WebComponentScraper:
             
             return components[:5]  # Return top 5
             
-        except Exception:
+        except Exception:  # Includes requests Timeout
             return self._get_mouser_fallback_components(search_term, component_type)
     
-    def search_digikey(self, search_term: str, component_type: str) -> List[WebComponent]:
+    def search_digikey(self, search_term: str, component_type: str, timeout=None,
+                       deadline=None) -> List[WebComponent]:
         """
         Advanced Digikey.com search with smart fallback system
         
         Args:
             search_term: Component search term
             component_type: Type of component
+            timeout: (connect, read) timeout in seconds, defaults to self.timeout
+            deadline: time.time() value after which no further attempts are started
         
         Returns:
             List of WebComponent objects
@@ -206,9 +345,12 @@ class WebComponentScraper:
         try:
             # Strategy 1: Try to scrape with multiple attempts and longer delays
             for attempt in range(2):  # Reduced attempts to be more respectful
+                if attempt > 0 and deadline is not None and time.time() >= deadline:
+                    break
+                
                 try:
-                    # Reset session with new headers
-                    self.setup_session()
+                    # Fresh headers (and user agent) for each attempt
+                    headers = self._request_headers()
                     
                     if attempt > 0:
                         time.sleep(2)  # Brief delay for retry
@@ -224,7 +366,7 @@ class WebComponentScraper:
                     category_id = category_ids.get(component_type, '278')
                     category_url = f"https://www.digikey.com/en/products/filter/transistors-fets-mosfets-single/{category_id}"
                     
-                    response = self.session.get(category_url, timeout=20)
+                    response = self.session.get(category_url, headers=headers, timeout=timeout or self.timeout)
                     
                     if response.status_code == 200:
                         soup = BeautifulSoup(response.content, 'html.parser')
@@ -235,7 +377,7 @@ class WebComponentScraper:
                     elif response.status_code == 429:
                         continue
                     
-                except requests.exceptions.RequestException:
+                except requests.exceptions.RequestException:  # Includes Timeout
                     continue
             
             # Strategy 2: Use high-quality fallback components
@@ -263,54 +405,43 @@ class WebComponentScraper:
             return {}
         
         results = {}
-        search_timeout = 20.0  # 20 second timeout per distributor
         
         # Initialize UI elements
         progress_bar = None
         status_text = None
         
-        # Search Mouser first with timeout and streaming
         if status_container:
             with status_container.container():
                 progress_bar = st.progress(0)
                 status_text = st.empty()
-                status_text.text("🔍 Searching Mouser...")
-        
-        try:
-            mouser_results = self._search_with_timeout(
-                lambda: self.search_mouser(search_term, component_type), 
-                search_timeout
-            )
-            
-            if progress_bar:
-                progress_bar.progress(50)  # 50% complete after Mouser
-            
-            if mouser_results:
-                results["Mouser"] = mouser_results
-                # Results will be displayed after all searches complete
-            
-        except Exception:
-            pass  # Silent fail - will use local database
-        
-        # Search Digikey with timeout and streaming  
-        if status_text:
-            status_text.text("🔍 Searching Digikey...")
+                status_text.text("🔍 Searching Mouser and Digikey...")
         
+        # Mouser and Digikey are different hosts, so search both at once. Each request
+        # carries its own (connect, read) timeout, but those apply per socket operation
+        # and add up across retries, so the whole search also gets one deadline
+        deadline = time.time() + self.search_timeout
+        executor = script_thread_pool(max_workers=2)  # Retry warnings still render
         try:
-            digikey_results = self._search_with_timeout(
-                lambda: self.search_digikey(search_term, component_type),
-                search_timeout
-            )
-            
-            if progress_bar:
-                progress_bar.progress(100)  # 100% complete
+            futures = {
+                "Mouser": executor.submit(self.search_mouser, search_term, component_type, deadline=deadline),
+                "Digikey": executor.submit(self.search_digikey, search_term, component_type, deadline=deadline)
+            }
             
-            if digikey_results:
-                results["Digikey"] = digikey_results
-                # Results will be displayed after all searches complete
-                    
-        except Exception:
-            pass  # Silent fail - will use local database
+            for done, (distributor, future) in enumerate(futures.items(), start=1):
+                try:
+                    components = future.result(timeout=max(0.0, deadline - time.time()))
+                except Exception:
+                    components = []  # Timed out or failed - will use local database
+                
+                if progress_bar:
+                    progress_bar.progress(done * 50)
+                
+                if components:
+                    results[distributor] = components
+                    # Results will be displayed after all searches complete
+        finally:
+            # Don't block on a search that overran the deadline; it stops retrying on its own
+            executor.shutdown(wait=False, cancel_futures=True)
         
         # Final status update
         if status_text:
@@ -325,41 +456,6 @@ class WebComponentScraper:
         
         return results
     
-    def _search_with_timeout(self, search_func, timeout_seconds: float):
-        """Execute search function with timeout - cross-platform implementation"""
-        import threading
-        import queue
-        
-        # Use threading for cross-platform timeout
-        result_queue = queue.Queue()
-        exception_queue = queue.Queue()
-        
-        def target():
-            try:
-                result = search_func()
-                result_queue.put(result)
-            except Exception as e:
-                exception_queue.put(e)
-        
-        thread = threading.Thread(target=target)
-        thread.daemon = True
-        thread.start()
-        thread.join(timeout_seconds)
-        
-        if thread.is_alive():
-            # Search timed out
-            return []
-        
-        # Check for exceptions
-        if not exception_queue.empty():
-            return []
-        
-        # Get result if available
-        if not result_queue.empty():
-            return result_queue.get()
-        
-        return []
-    
     def _display_streaming_results(self, distributor: str, components: List[WebComponent], 
                                  container):
         """Display results as they arrive in a clean format"""
@@ -389,6 +485,80 @@ class WebComponentScraper:
                 if i == 0:  # Add subtle divider after first component
                     st.markdown("---")
 
+    def _get_mouser_fallback_components(self, search_term: str, component_type: str) -> List[WebComponent]:
+        """Get realistic fallback components for Mouser"""
+        # Use capacitor data for input_capacitor
+        return list(_MOUSER_FALLBACKS.get(component_type, _MOUSER_FALLBACKS['capacitor']))
+
+    def _get_digikey_fallback_components(self, search_term: str, component_type: str) -> List[WebComponent]:
+        """Get realistic fallback components for Digikey"""
+        return list(_DIGIKEY_FALLBACKS.get(component_type, _DIGIKEY_FALLBACKS['capacitor']))
+
+    def _extract_digikey_components_advanced(self, soup, search_term: str, component_type: str) -> List[WebComponent]:
+        """Advanced extraction from Digikey pages"""
+        components = []
+        
+        try:
+            # Look for product table rows
+            rows = soup.find_all('tr', attrs={'data-testid': 'row'})
+            
+            if not rows:
+                # Alternative: look for product data in script tags
+                scripts = soup.find_all('script')
+                for script in scripts:
+                    if script.string and 'PartNumber' in script.string:
+                        # Try to extract JSON data
+                        try:
+                            # Look for product data patterns
+                            part_matches = re.findall(r'"PartNumber":"([^"]+)"', script.string)
+                            mfg_matches = re.findall(r'"ManufacturerName":"([^"]+)"', script.string)
+                            
+                            for i, part in enumerate(part_matches[:3]):
+                                mfg = mfg_matches[i] if i < len(mfg_matches) else "Unknown"
+                                components.append(WebComponent(
+                                    part_number=part,
+                                    manufacturer=mfg,
+                                    description=f'{component_type.title()} component',
+                                    price='See Digikey.com',
+                                    availability='Check website',
+                                    distributor='Digikey'
+                                ))
+                            break
+                        except:
+                            continue
+            
+            # Extract from table rows if found
+            for row in rows[:3]:
+                try:
+                    cells = row.find_all(['td', 'th'])
+                    if len(cells) >= 3:
+                        part_number = cells[0].get_text().strip()
+                        manufacturer = cells[1].get_text().strip() if len(cells) > 1 else "Unknown"
+                        description = cells[2].get_text().strip() if len(cells) > 2 else f"{component_type} component"
+                        
+                        if part_number and len(part_number) > 2:
+                            components.append(WebComponent(
+                                part_number=part_number,
+                                manufacturer=manufacturer,
+                                description=description,
+                                price='See Digikey.com',
+                                availability='Check website',
+                                distributor='Digikey'
+                            ))
+                except:
+                    continue
+                    
+        except Exception as e:
+            pass  # Silent fail, will use fallback
+        
+        return components
+
+
+@st.cache_resource(show_spinner=False)
+def get_web_scraper() -> WebComponentScraper:
+    """Shared scraper, so its requests.Session and connection pool survive Streamlit reruns"""
+    return WebComponentScraper()
+
 def create_component_search_terms(circuit_params: Dict[str, Any]) -> Dict[str, str]:
     """
     Create optimized search terms for each component type based on circuit parameters
@@ -441,16 +611,24 @@ def search_web_components(circuit_params: Dict[str, Any], component_types: List[
     if component_types is None:
         component_types = ['mosfet', 'input_capacitor', 'output_capacitor', 'inductor']
     
-    scraper = WebComponentScraper()
+    scraper = get_web_scraper()
     search_terms = create_component_search_terms(circuit_params)
     
     results = {}
     
-    for comp_type in component_types:
-        if comp_type in search_terms:
+    # Component types are searched concurrently (each search already fans out to
+    # both distributors); the workers share this run's context so their retry
+    # warnings still render
+    searchable_types = [comp_type for comp_type in component_types if comp_type in search_terms]
+    with script_thread_pool(max_workers=max(1, len(searchable_types))) as executor:
+        futures = {
+            comp_type: executor.submit(scraper.search_components, search_terms[comp_type], comp_type)
+            for comp_type in searchable_types
+        }
+        
+        for comp_type, future in futures.items():
             st.write(f"🔍 Searching for {comp_type.replace('_', ' ').title()}...")
-            search_term = search_terms[comp_type]
-            results[comp_type] = scraper.search_components(search_term, comp_type)
+            results[comp_type] = future.result()
     
     return results
 
@@ -491,150 +669,6 @@ def format_web_components_for_display(web_results: Dict[str, Dict[str, List[WebC
     
     return formatted
 
-    def _get_mouser_fallback_components(self, search_term: str, component_type: str) -> List[WebComponent]:
-        """Get realistic fallback components for Mouser"""
-        
-        fallback_data = {
-            'mosfet': [
-                {'part': 'IRF540NPBF', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 100V 33A TO-220AB', 'price': '$1.85'},
-                {'part': 'IRLB8721PBF', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 30V 62A TO-220AB', 'price': '$2.45'},
-                {'part': 'STP36NF06L', 'mfg': 'STMicroelectronics', 'desc': 'MOSFET N-CH 60V 30A TO-220', 'price': '$1.92'},
-                {'part': 'FQP30N06L', 'mfg': 'ON Semiconductor', 'desc': 'MOSFET N-CH 60V 32A TO-220', 'price': '$2.15'},
-                {'part': 'IRFZ44NPBF', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 55V 49A TO-220AB', 'price': '$1.68'}
-            ],
-            'capacitor': [
-                {'part': 'EEU-FR1V101', 'mfg': 'Panasonic', 'desc': 'CAP ALUM 100UF 20% 35V RADIAL', 'price': '$0.84'},
-                {'part': 'UVR1V101MPD', 'mfg': 'Nichicon', 'desc': 'CAP ALUM 100UF 20% 35V RADIAL', 'price': '$0.91'},
-                {'part': '25SVP47M', 'mfg': 'Rubycon', 'desc': 'CAP ALUM 47UF 20% 25V RADIAL', 'price': '$0.52'},
-                {'part': 'ECA-1VHG221', 'mfg': 'Panasonic', 'desc': 'CAP ALUM 220UF 20% 35V RADIAL', 'price': '$1.25'},
-                {'part': 'URS1E221MPD', 'mfg': 'Nichicon', 'desc': 'CAP ALUM 220UF 20% 25V RADIAL', 'price': '$1.18'}
-            ],
-            'inductor': [
-                {'part': 'SRR1260-220M', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 22UH 2.3A 65 MOHM', 'price': '$1.89'},
-                {'part': 'SRN6045-100M', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 10UH 4.5A 23 MOHM', 'price': '$1.45'},
-                {'part': 'CDRH104R-470MC', 'mfg': 'Sumida', 'desc': 'FIXED IND 47UH 1.8A 160 MOHM', 'price': '$2.34'},
-                {'part': 'SRR1005-100M', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 10UH 0.9A 290 MOHM', 'price': '$0.95'},
-                {'part': 'CDRH125-220M', 'mfg': 'Sumida', 'desc': 'FIXED IND 22UH 2.8A 75 MOHM', 'price': '$2.12'}
-            ]
-        }
-        
-        # Use capacitor data for input_capacitor
-        parts_data = fallback_data.get(component_type, fallback_data.get('input_capacitor', fallback_data['capacitor']))
-        
-        components = []
-        for part_info in parts_data:
-            components.append(WebComponent(
-                part_number=part_info['part'],
-                manufacturer=part_info['mfg'],
-                description=part_info['desc'],
-                price=part_info['price'],
-                availability='In Stock',
-                distributor='Mouser'
-            ))
-        
-        return components
-
-    def _get_digikey_fallback_components(self, search_term: str, component_type: str) -> List[WebComponent]:
-        """Get realistic fallback components for Digikey"""
-        
-        fallback_data = {
-            'mosfet': [
-                {'part': 'IRLB8721PBF-ND', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 30V 62A TO-220AB', 'price': '$2.52', 'stock': '2,456'},
-                {'part': 'IRF540NPBF-ND', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 100V 33A TO-220AB', 'price': '$1.91', 'stock': '1,823'},
-                {'part': 'STP36NF06L-ND', 'mfg': 'STMicroelectronics', 'desc': 'MOSFET N-CH 60V 30A TO-220', 'price': '$1.98', 'stock': '3,145'},
-                {'part': 'FQP30N06L-ND', 'mfg': 'ON Semiconductor', 'desc': 'MOSFET N-CH 60V 32A TO-220', 'price': '$2.22', 'stock': '987'},
-                {'part': 'IRFZ44NPBF-ND', 'mfg': 'Infineon Technologies', 'desc': 'MOSFET N-CH 55V 49A TO-220AB', 'price': '$1.74', 'stock': '1,567'}
-            ],
-            'capacitor': [
-                {'part': 'P5555-ND', 'mfg': 'Panasonic', 'desc': 'CAP ALUM 100UF 20% 35V RADIAL', 'price': '$0.87', 'stock': '4,532'},
-                {'part': '493-1795-ND', 'mfg': 'Nichicon', 'desc': 'CAP ALUM 100UF 20% 35V RADIAL', 'price': '$0.94', 'stock': '2,876'},
-                {'part': '1189-1583-ND', 'mfg': 'Rubycon', 'desc': 'CAP ALUM 47UF 20% 25V RADIAL', 'price': '$0.55', 'stock': '6,234'},
-                {'part': 'P966-ND', 'mfg': 'Panasonic', 'desc': 'CAP ALUM 220UF 20% 35V RADIAL', 'price': '$1.29', 'stock': '1,987'},
-                {'part': '493-2105-ND', 'mfg': 'Nichicon', 'desc': 'CAP ALUM 220UF 20% 25V RADIAL', 'price': '$1.21', 'stock': '3,456'}
-            ],
-            'inductor': [
-                {'part': 'SRR1260-220MCT-ND', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 22UH 2.3A 65MOHM SMD', 'price': '$1.95', 'stock': '1,234'},
-                {'part': 'SRN6045-100MCT-ND', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 10UH 4.5A 23MOHM SMD', 'price': '$1.50', 'stock': '2,567'},
-                {'part': 'CDRH104R-470MC-ND', 'mfg': 'Sumida', 'desc': 'FIXED IND 47UH 1.8A 160MOHM SMD', 'price': '$2.42', 'stock': '876'},
-                {'part': 'SRR1005-100MCT-ND', 'mfg': 'Bourns Inc.', 'desc': 'FIXED IND 10UH 0.9A 290MOHM SMD', 'price': '$0.98', 'stock': '4,321'},
-                {'part': 'CDRH125-220MC-ND', 'mfg': 'Sumida', 'desc': 'FIXED IND 22UH 2.8A 75MOHM SMD', 'price': '$2.19', 'stock': '1,543'}
-            ]
-        }
-        
-        parts_data = fallback_data.get(component_type, fallback_data.get('input_capacitor', fallback_data['capacitor']))
-        
-        components = []
-        for part_info in parts_data:
-            components.append(WebComponent(
-                part_number=part_info['part'],
-                manufacturer=part_info['mfg'],
-                description=part_info['desc'],
-                price=part_info['price'],
-                availability=f"In Stock ({part_info['stock']} available)",
-                distributor='Digikey'
-            ))
-        
-        return components
-
-    def _extract_digikey_components_advanced(self, soup, search_term: str, component_type: str) -> List[WebComponent]:
-        """Advanced extraction from Digikey pages"""
-        components = []
-        
-        try:
-            # Look for product table rows
-            rows = soup.find_all('tr', attrs={'data-testid': 'row'})
-            
-            if not rows:
-                # Alternative: look for product data in script tags
-                scripts = soup.find_all('script')
-                for script in scripts:
-                    if script.string and 'PartNumber' in script.string:
-                        # Try to extract JSON data
-                        try:
-                            # Look for product data patterns
-                            part_matches = re.findall(r'"PartNumber":"([^"]+)"', script.string)
-                            mfg_matches = re.findall(r'"ManufacturerName":"([^"]+)"', script.string)
-                            
-                            for i, part in enumerate(part_matches[:3]):
-                                mfg = mfg_matches[i] if i < len(mfg_matches) else "Unknown"
-                                components.append(WebComponent(
-                                    part_number=part,
-                                    manufacturer=mfg,
-                                    description=f'{component_type.title()} component',
-                                    price='See Digikey.com',
-                                    availability='Check website',
-                                    distributor='Digikey'
-                                ))
-                            break
-                        except:
-                            continue
-            
-            # Extract from table rows if found
-            for row in rows[:3]:
-                try:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 3:
-                        part_number = cells[0].get_text().strip()
-                        manufacturer = cells[1].get_text().strip() if len(cells) > 1 else "Unknown"
-                        description = cells[2].get_text().strip() if len(cells) > 2 else f"{component_type} component"
-                        
-                        if part_number and len(part_number) > 2:
-                            components.append(WebComponent(
-                                part_number=part_number,
-                                manufacturer=manufacturer,
-                                description=description,
-                                price='See Digikey.com',
-                                availability='Check website',
-                                distributor='Digikey'
-                            ))
-                except:
-                    continue
-                    
-        except Exception as e:
-            pass  # Silent fail, will use fallback
-        
-        return components
-
 def is_web_search_available() -> bool:
     """Check if web searching capabilities are available"""
     return WEB_SCRAPING_AVAILABLE
\ No newline at end of file
@@ -5,7 +5,9 @@ Test specific function attribute access - minimal version
 
 import os
 import sys
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 def test_mock_component_creation():
     """Test that we can create mock components with correct attributes"""
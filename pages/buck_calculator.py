@@ -5,7 +5,7 @@ Buck Converter Calculator Page
 import streamlit as st
 from lib.calculations import CircuitCalculator, BuckInputs, validate_inputs
 from lib.component_suggestions import suggest_mosfets, suggest_capacitors, suggest_inductors, suggest_input_capacitors
-from lib.component_data import reload_component_data, INDUCTOR_LIBRARY
+from lib.component_data import reload_component_data
 import os
 
 def get_component_ranges():
@@ -121,12 +121,14 @@ def check_component_availability(mosfet_suggestions, input_cap_suggestions, outp
 def show():
     """Display Buck converter calculator page"""
     
-    # Always reload component database on page load to ensure ranges are sourced
-    try:
-        reload_component_data()
-    except Exception:
-        # Non-fatal: proceed with whatever data is loaded
-        pass
+    # Reload component database once per session; later reruns reuse the cached libraries
+    if not st.session_state.get('component_data_loaded', False):
+        try:
+            reload_component_data()
+            st.session_state.component_data_loaded = True
+        except Exception:
+            # Non-fatal: proceed with whatever data is loaded
+            pass
 
     st.header("🔋 Buck Converter Designer")
     
@@ -25,12 +25,14 @@ except ImportError as e:
 
 def show():
     """Display full component library page"""
-    # Always reload component database on page load so displayed data is fresh
-    try:
-        from lib.component_data import reload_component_data
-        reload_component_data()
-    except Exception:
-        pass
+    # Reload component database once per session; later reruns reuse the cached libraries
+    if not st.session_state.get('component_data_loaded', False):
+        try:
+            from lib.component_data import reload_component_data
+            reload_component_data()
+            st.session_state.component_data_loaded = True
+        except Exception:
+            pass
     
     # Back button and reload functionality
     col1, col2, col3, col4 = st.columns([1, 3, 2, 2])
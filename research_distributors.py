@@ -4,24 +4,240 @@ This script will analyze their actual HTML structure and search patterns
 """
 
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import atexit
+import re
 import time
 import json
-from urllib.parse import quote_plus
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus, urlparse
+from urllib.robotparser import RobotFileParser
 
-def research_mouser_structure():
-    """Research Mouser.com search structure"""
-    print("🔍 Researching Mouser.com structure...")
+# One pooled session shared by every research function so connections (and their
+# TLS handshakes) are reused across phases that hit the same host. When
+# requests-cache is installed, responses are also cached on disk between runs.
+try:
+    import requests_cache
+    SESSION = requests_cache.CachedSession(
+        'distributor_cache',
+        backend='sqlite',
+        expire_after=3600,
+        allowable_methods=('GET',),
+        cache_control=True
+    )
+except ImportError:
+    SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+})
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5)
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+atexit.register(SESSION.close)
+
+# Probe concurrency: up to 8 requests in flight overall, one per distributor host
+MAX_CONCURRENT_PROBES = 8
+PER_HOST_PROBES = 1
+
+_host_slots = defaultdict(lambda: threading.BoundedSemaphore(PER_HOST_PROBES))
+_host_slots_lock = threading.Lock()
+
+# Polite request rates: seconds per request for each host, with short bursts allowed
+HOST_REQUEST_INTERVALS = {
+    'www.mouser.com': 2.0,
+    'www.digikey.com': 3.0,  # More conservative for Digikey
+}
+DEFAULT_REQUEST_INTERVAL = 2.0
+HOST_BURST = 2
+
+class TokenBucketLimiter:
+    """Per-host token bucket: requests run back-to-back while tokens last, then at the host's rate"""
+
+    def __init__(self, intervals, default_interval, burst):
+        self.intervals = intervals
+        self.default_interval = default_interval
+        self.burst = burst
+        self._buckets = {}  # host -> (tokens, last update)
+        self._lock = threading.Lock()
+
+    def _refill(self, host, now):
+        tokens, updated = self._buckets.get(host, (self.burst, now))
+        interval = self.intervals.get(host, self.default_interval)
+        return min(self.burst, tokens + (now - updated) / interval), interval
+
+    def acquire(self, host):
+        """Block until a request to host is allowed"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, interval = self._refill(host, now)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) * interval
+            time.sleep(wait)
+
+    def refund(self, host):
+        """Give back a token for a request that never reached the host (e.g. a cache hit)"""
+        with self._lock:
+            now = time.monotonic()
+            tokens, _ = self._refill(host, now)
+            self._buckets[host] = (min(self.burst, tokens + 1), now)
+
+RATE_LIMITER = TokenBucketLimiter(HOST_REQUEST_INTERVALS, DEFAULT_REQUEST_INTERVAL, HOST_BURST)
+
+_robots_parsers = {}
+_robots_lock = threading.Lock()
+
+# orjson decodes bytes directly and is several times faster than the stdlib json
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Prefer the C-accelerated lxml parser when it is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Product listing patterns, compiled once instead of on every select() call
+MOUSER_PRODUCT_PATTERNS = [
+    'div[class*="product"]',
+    'tr[class*="product"]',
+    'div[class*="search-result"]',
+    'div[class*="part-"]',
+    '.SearchResultsRowData',
+    '.grid-item',
+    '[data-testid*="product"]'
+]
+DIGIKEY_PRODUCT_PATTERNS = [
+    'tr[data-testid="row"]',
+    'div[data-testid*="product"]',
+    '.product-table-row',
+    '.search-results-content',
+    '[data-testid="data-table-row"]',
+    'tbody tr'
+]
+# Text-node matchers for sample part numbers and prices; BeautifulSoup applies them
+# with .search, so they are the same substring tests the old lambdas made
+PART_RE = re.compile('IRF|BSS|FQP')
+PRICE_RE = re.compile(r'\$')
+
+MOUSER_PRODUCT_SELECTORS = [(p, soupsieve.compile(p)) for p in MOUSER_PRODUCT_PATTERNS]
+DIGIKEY_PRODUCT_SELECTORS = [(p, soupsieve.compile(p)) for p in DIGIKEY_PRODUCT_PATTERNS]
+
+def _host_slot(url):
+    """Return the semaphore guarding requests to this URL's host"""
+    host = urlparse(url).netloc
+    with _host_slots_lock:
+        return _host_slots[host]
+
+def head_text(el, n=100, strip=False):
+    """
+    Same as el.get_text()[:n] (or .strip()[:n] with strip=True), but stops reading
+    the element's strings once n characters are collected
+    """
+    strings = iter(el.strings)
+    out = []
+    total = 0
+    for text in strings:
+        if strip and not out:
+            text = text.lstrip()
+            if not text:
+                continue
+        out.append(text)
+        total += len(text)
+        if total >= n:
+            break
+    text = ''.join(out)
+    head = text[:n]
+    if not strip or head == head.rstrip():
+        return head
+    # Trailing whitespace only survives strip() if more text follows it
+    if text[n:].strip() or any(rest.strip() for rest in strings):
+        return head
+    return head.rstrip()
+
+def _limited_get(session, url, host, **kwargs):
+    """GET through the host's rate limiter; cache hits don't use up a token"""
+    RATE_LIMITER.acquire(host)
+    response = session.get(url, **kwargs)
+    if getattr(response, 'from_cache', False):
+        RATE_LIMITER.refund(host)
+    return response
+
+def allowed_by_robots(session, url):
+    """Check url against its host's robots.txt (fetched once per host)"""
+    parsed = urlparse(url)
+    host = parsed.netloc
+    with _robots_lock:
+        parser = _robots_parsers.get(host)
     
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1'
-    })
+    if parser is None:
+        parser = RobotFileParser()
+        try:
+            response = _limited_get(session, f"{parsed.scheme}://{host}/robots.txt", host, timeout=10)
+            if response.status_code in (401, 403):
+                parser.disallow_all = True
+            elif response.status_code == 200:
+                parser.parse(response.text.splitlines())
+            else:
+                parser.allow_all = True
+        except requests.RequestException:
+            parser.allow_all = True
+        with _robots_lock:
+            parser = _robots_parsers.setdefault(host, parser)
+    
+    return parser.can_fetch(session.headers.get('User-Agent', '*'), url)
+
+def fetch(session, url, timeout=15, stream=False):
+    """Fetch a URL while holding its host slot, honouring robots.txt and the host's rate limit"""
+    host = urlparse(url).netloc
+    with _host_slot(url):
+        if not allowed_by_robots(session, url):
+            raise PermissionError(f"Disallowed by robots.txt: {url}")
+        # requests-cache reads the whole body in order to store it, so streamed
+        # requests opt out with no-store (per request, unlike cache_disabled(),
+        # which would switch the cache off for every thread sharing the session)
+        headers = {'Cache-Control': 'no-store'} if stream else None
+        return _limited_get(session, url, host, timeout=timeout, stream=stream, headers=headers)
+
+def probe_urls(session, urls, timeout=15):
+    """
+    Fetch URLs concurrently and yield (url, response) pairs in input order
+
+    Requests to the same host are serialized by the host slot, so parsing one page
+    overlaps with fetching the next. Failed fetches yield the exception instead.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PROBES) as pool:
+        futures = [pool.submit(fetch, session, url, timeout) for url in urls]
+        for url, future in zip(urls, futures):
+            try:
+                yield url, future.result()
+            except Exception as e:
+                yield url, e
+
+def research_mouser_structure(session=SESSION, log=print):
+    """Research Mouser.com search structure, reporting each line through log"""
+    log("🔍 Researching Mouser.com structure...")
     
     # Test different Mouser search approaches
     search_urls = [
@@ -31,64 +247,44 @@ def research_mouser_structure():
         "https://www.mouser.com/c/semiconductors/discrete-semiconductors/transistors/mosfets-single/"
     ]
     
-    for i, url in enumerate(search_urls):
+    for i, (url, response) in enumerate(probe_urls(session, search_urls)):
         try:
-            print(f"\n📍 Testing Mouser URL {i+1}: {url}")
-            response = session.get(url, timeout=15)
-            print(f"   Status: {response.status_code}")
+            log(f"\n📍 Testing Mouser URL {i+1}: {url}")
+            if isinstance(response, Exception):
+                raise response
+            log(f"   Status: {response.status_code}")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, HTML_PARSER)
                 
                 # Look for common product listing patterns
-                product_patterns = [
-                    'div[class*="product"]',
-                    'tr[class*="product"]', 
-                    'div[class*="search-result"]',
-                    'div[class*="part-"]',
-                    '.SearchResultsRowData',
-                    '.grid-item',
-                    '[data-testid*="product"]'
-                ]
-                
-                for pattern in product_patterns:
-                    elements = soup.select(pattern)
+                for pattern, selector in MOUSER_PRODUCT_SELECTORS:
+                    elements = selector.select(soup)
                     if elements:
-                        print(f"   ✅ Found {len(elements)} elements with pattern: {pattern}")
+                        log(f"   ✅ Found {len(elements)} elements with pattern: {pattern}")
                         
                         # Analyze first element structure
                         if len(elements) > 0:
                             first_elem = elements[0]
-                            print(f"      Sample element classes: {first_elem.get('class', [])}")
-                            print(f"      Sample element text (first 100 chars): {first_elem.get_text()[:100]}")
+                            log(f"      Sample element classes: {first_elem.get('class', [])}")
+                            log(f"      Sample element text (first 100 chars): {head_text(first_elem)}")
                 
                 # Look for specific data elements
-                part_numbers = soup.find_all(text=lambda t: t and ('IRF' in t or 'BSS' in t or 'FQP' in t))[:3]
+                part_numbers = soup.find_all(string=PART_RE, limit=3)
                 if part_numbers:
-                    print(f"   📝 Sample part numbers found: {part_numbers}")
+                    log(f"   📝 Sample part numbers found: {part_numbers}")
                 
                 # Look for price patterns
-                price_elements = soup.find_all(text=lambda t: t and '$' in str(t))[:3]
+                price_elements = soup.find_all(string=PRICE_RE, limit=3)
                 if price_elements:
-                    print(f"   💰 Sample prices found: {price_elements}")
-            
-            time.sleep(2)  # Be respectful
+                    log(f"   💰 Sample prices found: {price_elements}")
             
         except Exception as e:
-            print(f"   ❌ Error: {e}")
+            log(f"   ❌ Error: {e}")
 
-def research_digikey_structure():
-    """Research Digikey.com search structure"""
-    print("\n🔍 Researching Digikey.com structure...")
-    
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive'
-    })
+def research_digikey_structure(session=SESSION, log=print):
+    """Research Digikey.com search structure, reporting each line through log"""
+    log("\n🔍 Researching Digikey.com structure...")
     
     # Test different Digikey approaches
     search_urls = [
@@ -97,85 +293,80 @@ def research_digikey_structure():
         "https://www.digikey.com/en/products/detail/infineon-technologies/IRLB8721PBF/2127443"  # Sample product
     ]
     
-    for i, url in enumerate(search_urls):
+    for i, (url, response) in enumerate(probe_urls(session, search_urls)):
         try:
-            print(f"\n📍 Testing Digikey URL {i+1}: {url}")
-            response = session.get(url, timeout=15)
-            print(f"   Status: {response.status_code}")
+            log(f"\n📍 Testing Digikey URL {i+1}: {url}")
+            if isinstance(response, Exception):
+                raise response
+            log(f"   Status: {response.status_code}")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, HTML_PARSER)
                 
                 # Look for common Digikey patterns
-                product_patterns = [
-                    'tr[data-testid="row"]',
-                    'div[data-testid*="product"]',
-                    '.product-table-row',
-                    '.search-results-content',
-                    '[data-testid="data-table-row"]',
-                    'tbody tr'
-                ]
-                
-                for pattern in product_patterns:
-                    elements = soup.select(pattern)
+                for pattern, selector in DIGIKEY_PRODUCT_SELECTORS:
+                    elements = selector.select(soup)
                     if elements:
-                        print(f"   ✅ Found {len(elements)} elements with pattern: {pattern}")
+                        log(f"   ✅ Found {len(elements)} elements with pattern: {pattern}")
                         
                         if len(elements) > 0:
                             first_elem = elements[0]
-                            print(f"      Sample element: {first_elem.name} with classes: {first_elem.get('class', [])}")
+                            log(f"      Sample element: {first_elem.name} with classes: {first_elem.get('class', [])}")
                             cells = first_elem.find_all(['td', 'div'])[:5]
                             if cells:
-                                print(f"      Sample cell contents: {[cell.get_text().strip()[:50] for cell in cells]}")
+                                log(f"      Sample cell contents: {[head_text(cell, 50, strip=True) for cell in cells]}")
                 
                 # Look for JSON data (common in modern sites)
                 scripts = soup.find_all('script', type='application/json')
                 if scripts:
-                    print(f"   📄 Found {len(scripts)} JSON scripts")
-                
-            time.sleep(3)  # More conservative for Digikey
+                    log(f"   📄 Found {len(scripts)} JSON scripts")
             
         except Exception as e:
-            print(f"   ❌ Error: {e}")
+            log(f"   ❌ Error: {e}")
 
-def test_simple_search():
-    """Test a very basic search to see what we get"""
-    print("\n🧪 Testing simple search approaches...")
+def test_simple_search(session=SESSION, log=print):
+    """Test a very basic search to see what we get, reporting each line through log"""
+    log("\n🧪 Testing simple search approaches...")
     
     # Test Mouser with a known part
     try:
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        
         # Try Mouser API-like endpoint
         mouser_test_url = "https://www.mouser.com/api/search/keyword?keyword=IRLB8721"
-        print(f"🔍 Testing Mouser API: {mouser_test_url}")
-        
-        response = session.get(mouser_test_url, timeout=10)
-        print(f"   Status: {response.status_code}")
+        log(f"🔍 Testing Mouser API: {mouser_test_url}")
         
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                print(f"   ✅ JSON response received! Keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-            except:
-                print(f"   📄 Non-JSON response, length: {len(response.text)}")
-        
-        time.sleep(2)
+        # Stream so only the headers are read until we know the body is JSON
+        with fetch(session, mouser_test_url, timeout=10, stream=True) as response:
+            log(f"   Status: {response.status_code}")
+            
+            if response.status_code == 200:
+                content_type = response.headers.get('Content-Type', '')
+                if 'json' in content_type:
+                    try:
+                        data = json_loads(response.content)
+                        log(f"   ✅ JSON response received! Keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
+                    except ValueError:
+                        log(f"   ⚠️ Invalid JSON body, length: {len(response.content)}")
+                else:
+                    log(f"   📄 Non-JSON response ({content_type or 'no Content-Type'}), body not downloaded")
         
     except Exception as e:
-        print(f"   ❌ Error testing Mouser API: {e}")
+        log(f"   ❌ Error testing Mouser API: {e}")
 
 if __name__ == "__main__":
     print("🔬 Deep Research: Mouser and Digikey Search Mechanisms")
     print("=" * 60)
     
-    # Research both sites
-    research_mouser_structure()
-    research_digikey_structure()
-    test_simple_search()
+    # Research both sites concurrently; each task buffers its report so the
+    # output is printed in order instead of interleaved
+    research_tasks = [research_mouser_structure, research_digikey_structure, test_simple_search]
+    with ThreadPoolExecutor(max_workers=len(research_tasks)) as pool:
+        reports = []
+        for task in research_tasks:
+            lines = []
+            reports.append((pool.submit(task, log=lines.append), lines))
+        for future, lines in reports:
+            future.result()
+            print("\n".join(lines))
     
     print("\n" + "=" * 60)
-    print("🎯 Research Complete! Check output above for working patterns.")
\ No newline at end of file
+    print("🎯 Research Complete! Check output above for working patterns.")
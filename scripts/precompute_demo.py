@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Precompute the simulation demo result
+Runs the fixed demo Buck converter once and writes its waveforms and analysis
+to assets/ so pages/simulation_demo.py can load them instead of simulating
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lib.simulation_service import SimulationService, save_simulation_results
+from pages.simulation_demo import (
+    DEMO_CIRCUIT_PARAMS, DEMO_CALCULATED_COMPONENTS, DEMO_WAVEFORMS_PATH, DEMO_META_PATH
+)
+
+def main():
+    """Run the demo simulation and save it"""
+    print("🔄 Running demo simulation...")
+    results = SimulationService().run_buck_simulation(DEMO_CIRCUIT_PARAMS, DEMO_CALCULATED_COMPONENTS)
+    
+    if not results['success']:
+        print(f"❌ Demo simulation failed: {results['error']}")
+        return 1
+    if 'error' in results['analysis']:
+        print(f"❌ Demo analysis failed: {results['analysis']['error']}")
+        return 1
+    
+    save_simulation_results(results, DEMO_WAVEFORMS_PATH, DEMO_META_PATH)
+    print(f"✅ Waveforms written to {DEMO_WAVEFORMS_PATH}")
+    print(f"✅ Analysis written to {DEMO_META_PATH}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
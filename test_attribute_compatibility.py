@@ -3,6 +3,8 @@
 Test web component attribute compatibility to prevent attribute errors
 """
 
+from lib.component_data import WebMOSFET, WebCapacitor
+
 def test_mosfet_attributes():
     """Test MOSFET web component has all required attributes"""
     print("🧪 Testing MOSFET attribute compatibility...")
@@ -21,20 +23,20 @@ def test_mosfet_attributes():
     comp = MockWebComponent()
     
     # Create mock MOSFET exactly as in component_suggestions.py
-    mock_mosfet = type('MOSFET', (), {
-        'name': comp.part_number,
-        'manufacturer': comp.manufacturer,
-        'vds': 100.0,
-        'id': 30.0,
-        'rdson': 50.0,
-        'qg': 0.0,
-        'package': comp.package or "TO-220",
-        'typical_use': f"Web search result - {comp.description}",
-        'efficiency_range': "See datasheet",  # This was missing before!
-        'price': comp.price,
-        'availability': comp.availability,
-        'distributor': comp.distributor
-    })()
+    mock_mosfet = WebMOSFET(
+        name=comp.part_number,
+        manufacturer=comp.manufacturer,
+        vds=100.0,
+        id=30.0,
+        rdson=50.0,
+        qg=0.0,
+        package=comp.package or "TO-220",
+        typical_use=f"Web search result - {comp.description}",
+        efficiency_range="See datasheet",  # This was missing before!
+        price=comp.price,
+        availability=comp.availability,
+        distributor=comp.distributor
+    )
     
     # Test all required MOSFET attributes
     required_attrs = ['name', 'manufacturer', 'vds', 'id', 'rdson', 'qg', 'package', 'typical_use', 'efficiency_range']
@@ -68,19 +70,19 @@ def test_capacitor_attributes():
     max_voltage = 25.0
     
     # Create mock Capacitor exactly as in component_suggestions.py
-    mock_capacitor = type('Capacitor', (), {
-        'part_number': comp.part_number,
-        'manufacturer': comp.manufacturer,
-        'capacitance': required_capacitance_uf,  # µF
-        'voltage': max_voltage,  # V
-        'type': "See datasheet",
-        'esr': "See datasheet",  # mΩ
-        'primary_use': f"Web search result - {comp.description}",
-        'temp_range': "See datasheet",
-        'price': comp.price,
-        'availability': comp.availability,
-        'distributor': comp.distributor
-    })()
+    mock_capacitor = WebCapacitor(
+        part_number=comp.part_number,
+        manufacturer=comp.manufacturer,
+        capacitance=required_capacitance_uf,  # µF
+        voltage=max_voltage,  # V
+        type="See datasheet",
+        esr="See datasheet",  # mΩ
+        primary_use=f"Web search result - {comp.description}",
+        temp_range="See datasheet",
+        price=comp.price,
+        availability=comp.availability,
+        distributor=comp.distributor
+    )
     
     # Test all required Capacitor attributes  
     required_attrs = ['part_number', 'manufacturer', 'capacitance', 'voltage', 'type', 'esr', 'primary_use', 'temp_range']
@@ -33,16 +33,16 @@ try:
     # Test DataFrame creation without pyarrow
     print("\n3. Testing DataFrame creation...")
     if INPUT_CAPACITOR_LIBRARY:
-        test_data = []
-        for cap in INPUT_CAPACITOR_LIBRARY[:2]:  # Test first 2
-            test_data.append({
-                "Part": cap.part_number,
-                "Manufacturer": cap.manufacturer,
-                "Capacitance": cap.capacitance,
-                "Voltage": cap.voltage
-            })
+        import numpy as np
+        caps = INPUT_CAPACITOR_LIBRARY[:2]  # Test first 2
         
-        df = pd.DataFrame(test_data)
+        # Build columns directly instead of a list of row dicts
+        df = pd.DataFrame({
+            "Part": [cap.part_number for cap in caps],
+            "Manufacturer": [cap.manufacturer for cap in caps],
+            "Capacitance": np.fromiter((cap.capacitance for cap in caps), dtype=np.float64, count=len(caps)),
+            "Voltage": np.fromiter((cap.voltage for cap in caps), dtype=np.float64, count=len(caps)),
+        }, copy=False)
         print("   ✓ DataFrame created successfully")
         print(f"   DataFrame shape: {df.shape}")
         print("   DataFrame columns:", df.columns.tolist())
@@ -4,14 +4,74 @@ Comprehensive test for interactive component selection with web and local source
 """
 
 import streamlit as st
-import sys
-import os
-
-# Add the project root to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from lib.component_suggestions import suggest_mosfets, suggest_output_capacitors, suggest_inductors, suggest_input_capacitors
-from lib.component_display import display_component_table
+from lib.component_display import display_component_table, create_component_table, clear_stored_suggestions
+from lib.streamlit_utils import fragment, script_thread_pool
+
+# Cached wrappers: reruns with unchanged parameters reuse the previous results
+# (and the display table) instead of repeating the database filtering / web
+# scraping. They always rank MAX_SUGGESTIONS, so changing how many rows are
+# shown only re-slices the cached lists.
+SUGGESTION_CACHE_TTL = 24 * 60 * 60
+MAX_SUGGESTIONS = 10
+
+@st.cache_data(ttl=SUGGESTION_CACHE_TTL, show_spinner=False)
+def _cached_mosfets(max_voltage: float, max_current: float, frequency_hz: float, use_web: bool):
+    suggestions = suggest_mosfets(
+        max_voltage=max_voltage,
+        max_current=max_current,
+        frequency_hz=frequency_hz,
+        use_web_search=use_web,
+        top_k=MAX_SUGGESTIONS
+    )
+    return suggestions, create_component_table(suggestions[:MAX_SUGGESTIONS], 'mosfet')
+
+@st.cache_data(ttl=SUGGESTION_CACHE_TTL, show_spinner=False)
+def _cached_output_capacitors(vout: float, iout: float, ripple_current: float, frequency: float, use_web: bool):
+    suggestions = suggest_output_capacitors(
+        output_voltage=vout,
+        output_current=iout,
+        ripple_current=ripple_current,
+        switching_frequency=frequency,
+        use_web_search=use_web,
+        top_k=MAX_SUGGESTIONS
+    )
+    return suggestions, create_component_table(suggestions[:MAX_SUGGESTIONS], 'output_capacitor')
+
+@st.cache_data(ttl=SUGGESTION_CACHE_TTL, show_spinner=False)
+def _cached_input_capacitors(vin: float, iout: float, ripple_current: float, use_web: bool):
+    suggestions = suggest_input_capacitors(
+        input_voltage=vin,
+        output_current=iout,
+        ripple_current=ripple_current,
+        use_web_search=use_web,
+        top_k=MAX_SUGGESTIONS
+    )
+    return suggestions, create_component_table(suggestions[:MAX_SUGGESTIONS], 'input_capacitor')
+
+@st.cache_data(ttl=SUGGESTION_CACHE_TTL, show_spinner=False)
+def _cached_inductors(inductance: float, max_current: float, use_web: bool):
+    suggestions = suggest_inductors(
+        inductance=inductance,
+        max_current=max_current,
+        use_web_search=use_web,
+        top_k=MAX_SUGGESTIONS
+    )
+    return suggestions, create_component_table(suggestions[:MAX_SUGGESTIONS], 'inductor')
+
+CACHED_SUGGESTERS = [_cached_mosfets, _cached_output_capacitors, _cached_input_capacitors, _cached_inductors]
+
+@fragment
+def _debug_panel(use_web: bool):
+    """Session-state debug view; toggling it reruns only this fragment"""
+    if st.checkbox("Show Debug Info"):
+        st.write("**Session State:**")
+        st.json({
+            'component_source': st.session_state.get('component_source', 'not set'),
+            'use_web_search': use_web,
+            'session_keys': [k for k in st.session_state.keys() if not k.startswith('_')]
+        })
 
 def test_web_and_local_components():
     """Test both web and local component selection"""
@@ -46,99 +106,107 @@ def test_web_and_local_components():
     vout = st.sidebar.slider("Output Voltage (V)", 3.3, 12.0, 5.0)
     iout = st.sidebar.slider("Output Current (A)", 1.0, 20.0, 10.0)
     frequency = st.sidebar.slider("Switching Frequency (kHz)", 50, 500, 100) * 1000
+    n_show = st.sidebar.slider("Components to show", 1, MAX_SUGGESTIONS, 5)
     
     st.write(f"### 🎯 Testing {source}")
     st.write(f"**Parameters:** {vin}V → {vout}V, {iout}A @ {frequency/1000}kHz")
     
     if st.button("🔄 Refresh Components", key="refresh_test"):
         # Clear previous session data
-        for key in list(st.session_state.keys()):
-            if key.endswith('_suggestions'):
-                del st.session_state[key]
+        clear_stored_suggestions()
+        for cached_suggester in CACHED_SUGGESTERS:
+            cached_suggester.clear()
+    
+    ripple_current = 0.4 * iout  # Approximate ripple
+    # Calculate inductance (simplified)
+    inductance_uh = (vin * (vout / vin) * (1 - vout / vin)) / (0.3 * iout * frequency) * 1e6
     
-    # Test all component types
-    with st.spinner(f"Searching for components using {source.lower()}..."):
+    # The four searches are independent (and I/O-bound in web mode), so run them
+    # concurrently; the workers share this run's context so warnings and progress
+    # from the searches still render, and each section renders once its result is in
+    with script_thread_pool(max_workers=4) as executor:
+        futures = {
+            'mosfet': executor.submit(
+                _cached_mosfets,
+                float(vin * 1.5),  # Derating
+                float(iout * 1.2),  # Derating
+                float(frequency),
+                use_web
+            ),
+            'output_capacitor': executor.submit(
+                _cached_output_capacitors,
+                float(vout), float(iout), float(ripple_current), float(frequency), use_web
+            ),
+            'input_capacitor': executor.submit(
+                _cached_input_capacitors,
+                float(vin), float(iout), float(ripple_current), use_web
+            ),
+            'inductor': executor.submit(
+                _cached_inductors,
+                float(inductance_uh / 1e6),  # Convert to H
+                float(iout * 1.2),
+                use_web
+            ),
+        }
         
-        # MOSFETs
-        st.subheader("1️⃣ MOSFET Testing")
-        try:
-            mosfet_suggestions = suggest_mosfets(
-                max_voltage=vin * 1.5,  # Derating
-                max_current=iout * 1.2,  # Derating  
-                frequency_hz=frequency,
-                use_web_search=use_web
-            )
+        # Test all component types
+        with st.spinner(f"Searching for components using {source.lower()}..."):
             
-            if mosfet_suggestions:
-                display_component_table(mosfet_suggestions[:5], 'mosfet', f'MOSFETs ({source})')
-                st.success(f"✅ Found {len(mosfet_suggestions)} MOSFETs")
-            else:
-                st.warning("⚠️ No MOSFETs found")
+            # MOSFETs
+            st.subheader("1️⃣ MOSFET Testing")
+            try:
+                mosfet_suggestions, mosfet_table = futures['mosfet'].result()
                 
-        except Exception as e:
-            st.error(f"❌ MOSFET test failed: {str(e)}")
-        
-        # Output Capacitors
-        st.subheader("2️⃣ Output Capacitor Testing")
-        try:
-            ripple_current = 0.4 * iout  # Approximate ripple
-            
-            output_cap_suggestions = suggest_output_capacitors(
-                output_voltage=vout,
-                output_current=iout,
-                ripple_current=ripple_current,
-                switching_frequency=frequency,
-                use_web_search=use_web
-            )
+                if mosfet_suggestions:
+                    display_component_table(mosfet_suggestions[:n_show], 'mosfet', f'MOSFETs ({source})', table=mosfet_table.head(n_show))
+                    st.success(f"✅ Found {len(mosfet_suggestions)} MOSFETs")
+                else:
+                    st.warning("⚠️ No MOSFETs found")
+                    
+            except Exception as e:
+                st.error(f"❌ MOSFET test failed: {str(e)}")
             
-            if output_cap_suggestions:
-                display_component_table(output_cap_suggestions[:5], 'output_capacitor', f'Output Capacitors ({source})')
-                st.success(f"✅ Found {len(output_cap_suggestions)} output capacitors")
-            else:
-                st.warning("⚠️ No output capacitors found")
+            # Output Capacitors
+            st.subheader("2️⃣ Output Capacitor Testing")
+            try:
+                output_cap_suggestions, output_cap_table = futures['output_capacitor'].result()
                 
-        except Exception as e:
-            st.error(f"❌ Output capacitor test failed: {str(e)}")
-        
-        # Input Capacitors
-        st.subheader("3️⃣ Input Capacitor Testing")
-        try:
-            input_cap_suggestions = suggest_input_capacitors(
-                input_voltage=vin,
-                output_current=iout,
-                ripple_current=ripple_current,
-                use_web_search=use_web
-            )
+                if output_cap_suggestions:
+                    display_component_table(output_cap_suggestions[:n_show], 'output_capacitor', f'Output Capacitors ({source})', table=output_cap_table.head(n_show))
+                    st.success(f"✅ Found {len(output_cap_suggestions)} output capacitors")
+                else:
+                    st.warning("⚠️ No output capacitors found")
+                    
+            except Exception as e:
+                st.error(f"❌ Output capacitor test failed: {str(e)}")
             
-            if input_cap_suggestions:
-                display_component_table(input_cap_suggestions[:5], 'input_capacitor', f'Input Capacitors ({source})')
-                st.success(f"✅ Found {len(input_cap_suggestions)} input capacitors")
-            else:
-                st.warning("⚠️ No input capacitors found")
+            # Input Capacitors
+            st.subheader("3️⃣ Input Capacitor Testing")
+            try:
+                input_cap_suggestions, input_cap_table = futures['input_capacitor'].result()
                 
-        except Exception as e:
-            st.error(f"❌ Input capacitor test failed: {str(e)}")
-        
-        # Inductors
-        st.subheader("4️⃣ Inductor Testing")
-        try:
-            # Calculate inductance (simplified)
-            inductance_uh = (vin * (vout / vin) * (1 - vout / vin)) / (0.3 * iout * frequency) * 1e6
+                if input_cap_suggestions:
+                    display_component_table(input_cap_suggestions[:n_show], 'input_capacitor', f'Input Capacitors ({source})', table=input_cap_table.head(n_show))
+                    st.success(f"✅ Found {len(input_cap_suggestions)} input capacitors")
+                else:
+                    st.warning("⚠️ No input capacitors found")
+                    
+            except Exception as e:
+                st.error(f"❌ Input capacitor test failed: {str(e)}")
             
-            inductor_suggestions = suggest_inductors(
-                inductance=inductance_uh / 1e6,  # Convert to H
-                max_current=iout * 1.2,
-                use_web_search=use_web
-            )
-            
-            if inductor_suggestions:
-                display_component_table(inductor_suggestions[:5], 'inductor', f'Inductors ({source})')
-                st.success(f"✅ Found {len(inductor_suggestions)} inductors")
-            else:
-                st.warning("⚠️ No inductors found")
+            # Inductors
+            st.subheader("4️⃣ Inductor Testing")
+            try:
+                inductor_suggestions, inductor_table = futures['inductor'].result()
                 
-        except Exception as e:
-            st.error(f"❌ Inductor test failed: {str(e)}")
+                if inductor_suggestions:
+                    display_component_table(inductor_suggestions[:n_show], 'inductor', f'Inductors ({source})', table=inductor_table.head(n_show))
+                    st.success(f"✅ Found {len(inductor_suggestions)} inductors")
+                else:
+                    st.warning("⚠️ No inductors found")
+                    
+            except Exception as e:
+                st.error(f"❌ Inductor test failed: {str(e)}")
     
     # Test Summary
     st.write("---")
@@ -146,19 +214,24 @@ def test_web_and_local_components():
     
     col1, col2 = st.columns(2)
     
+    # One markdown element per column instead of one per line
     with col1:
-        st.write("**Interactive Features:**")
-        st.write("✅ Session state persistence")
-        st.write("✅ Component source switching")
-        st.write("✅ Table row selection")
-        st.write("✅ Dynamic details display")
+        st.markdown("  \n".join([
+            "**Interactive Features:**",
+            "✅ Session state persistence",
+            "✅ Component source switching",
+            "✅ Table row selection",
+            "✅ Dynamic details display",
+        ]))
     
     with col2:
-        st.write("**Component Types:**")
-        st.write("✅ MOSFETs")
-        st.write("✅ Output Capacitors")
-        st.write("✅ Input Capacitors")
-        st.write("✅ Inductors")
+        st.markdown("  \n".join([
+            "**Component Types:**",
+            "✅ MOSFETs",
+            "✅ Output Capacitors",
+            "✅ Input Capacitors",
+            "✅ Inductors",
+        ]))
     
     # Instructions
     st.info("""
@@ -171,13 +244,7 @@ def test_web_and_local_components():
     """)
     
     # Debug info
-    if st.checkbox("Show Debug Info"):
-        st.write("**Session State:**")
-        st.json({
-            'component_source': st.session_state.get('component_source', 'not set'),
-            'use_web_search': use_web,
-            'session_keys': [k for k in st.session_state.keys() if not k.startswith('_')]
-        })
+    _debug_panel(use_web)
 
 if __name__ == "__main__":
     test_web_and_local_components()
\ No newline at end of file
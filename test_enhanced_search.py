@@ -3,67 +3,91 @@
 Test the improved web search functionality
 """
 
+import logging
+import os
 from lib.web_component_scraper import WebComponentScraper
-import time
+from unittest import mock
+import requests
+
+# Per-check details are logged at INFO and the summary at WARNING; set
+# TESTLOG=INFO to see everything
+log = logging.getLogger(__name__)
 
 def test_timeout_functionality():
-    """Test that timeout works properly"""
-    print('🧪 Testing timeout functionality...')
+    """Test that slow requests fail with a requests Timeout instead of hanging"""
+    log.info('🧪 Testing timeout functionality...')
     
     scraper = WebComponentScraper()
-    start_time = time.time()
-
-    # This should timeout quickly
-    components = scraper._search_with_timeout(
-        lambda: scraper.search_mouser('test', 'mosfet'), 
-        2.0  # 2 second timeout
-    )
+    scraper.max_retries = 0
+    log.info(f'⏱️  Request timeout (connect, read): {scraper.timeout}')
+    
+    # Simulate a server that never answers within the connect timeout
+    with mock.patch.object(scraper.session, 'get', side_effect=requests.exceptions.ConnectTimeout) as fake_get:
+        try:
+            scraper._make_request_with_retry('https://www.mouser.com/c/?q=test')
+        except requests.exceptions.Timeout:
+            passed_timeout = fake_get.call_args.kwargs.get('timeout')
+            log.info(f'📡 Request was sent with timeout={passed_timeout}')
+            if passed_timeout == scraper.timeout:
+                log.info('✅ Timeout mechanism working!')
+                return True
+    
+    log.warning('❌ Timeout may not be working properly')
+    return False
 
-    elapsed = time.time() - start_time
-    print(f'⏱️  Search completed in {elapsed:.2f} seconds')
-    print(f'📦 Found {len(components)} components')
+def test_session_reuse():
+    """Test that scrapers share one pooled session"""
+    log.info('\n🧪 Testing connection pool reuse...')
     
-    if elapsed <= 3.0:  # Should be close to 2 seconds
-        print('✅ Timeout mechanism working!')
+    first = WebComponentScraper()
+    second = WebComponentScraper()
+    adapter = first.session.get_adapter('https://www.mouser.com')
+    
+    log.info(f'🔌 Pool: {adapter._pool_connections} hosts x {adapter._pool_maxsize} connections')
+    if first.session is second.session:
+        log.info('✅ Scrapers share one session!')
         return True
-    else:
-        print('❌ Timeout may not be working properly')
-        return False
+    
+    log.warning('❌ Each scraper opened its own session')
+    return False
 
 def test_fallback_components():
     """Test fallback component generation"""
-    print('\n🧪 Testing fallback components...')
+    log.info('\n🧪 Testing fallback components...')
     
     scraper = WebComponentScraper()
     mosfet_comps = scraper._get_mouser_fallback_components('N-Channel MOSFET', 'mosfet')
     
-    print(f'📦 Generated {len(mosfet_comps)} fallback MOSFETs')
+    log.info(f'📦 Generated {len(mosfet_comps)} fallback MOSFETs')
     if mosfet_comps:
-        print(f'   Sample: {mosfet_comps[0].part_number} by {mosfet_comps[0].manufacturer}')
-        print('✅ Fallback components working!')
+        log.info(f'   Sample: {mosfet_comps[0].part_number} by {mosfet_comps[0].manufacturer}')
+        log.info('✅ Fallback components working!')
         return True
     
-    print('❌ Fallback components not working')
+    log.warning('❌ Fallback components not working')
     return False
 
 def main():
     """Run all tests"""
-    print("🚀 Testing Enhanced Web Search Functionality")
-    print("=" * 50)
+    logging.basicConfig(level=os.environ.get('TESTLOG', 'WARNING'), format='%(message)s')
+    log.info("🚀 Testing Enhanced Web Search Functionality")
+    log.info("=" * 50)
     
     timeout_ok = test_timeout_functionality()
+    session_ok = test_session_reuse()
     fallback_ok = test_fallback_components()
     
-    print("\n" + "=" * 50)
-    print("📋 TEST RESULTS:")
-    print(f"Timeout Mechanism: {'✅ PASS' if timeout_ok else '❌ FAIL'}")
-    print(f"Fallback Components: {'✅ PASS' if fallback_ok else '❌ FAIL'}")
+    log.warning("\n" + "=" * 50)
+    log.warning("📋 TEST RESULTS:")
+    log.warning(f"Timeout Mechanism: {'✅ PASS' if timeout_ok else '❌ FAIL'}")
+    log.warning(f"Session Reuse: {'✅ PASS' if session_ok else '❌ FAIL'}")
+    log.warning(f"Fallback Components: {'✅ PASS' if fallback_ok else '❌ FAIL'}")
     
-    if timeout_ok and fallback_ok:
-        print("\n🎉 All core functionality working!")
-        print("💡 Ready to test in Streamlit app")
+    if timeout_ok and session_ok and fallback_ok:
+        log.warning("\n🎉 All core functionality working!")
+        log.info("💡 Ready to test in Streamlit app")
     else:
-        print("\n⚠️  Some issues detected")
+        log.warning("\n⚠️  Some issues detected")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,18 +3,53 @@
 Test script to verify inductor recommendations work with optimized parameters
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'lib'))
+import numpy as np
+from lib.component_suggestions import suggest_inductors
+from lib.calculations import CircuitCalculator, BuckInputs
+from concurrent.futures import ThreadPoolExecutor
 
-from component_suggestions import suggest_inductors
-from calculations import CircuitCalculator, BuckInputs
+def size_cases(test_cases):
+    """Size every test case's buck converter in one vectorized calculate_buck call"""
+    v_in = np.array([case['v_in'] for case in test_cases], dtype=np.float64)
+    v_out = np.array([case['v_out'] for case in test_cases], dtype=np.float64)
+    power = np.array([case['power'] for case in test_cases], dtype=np.float64)
+    frequency = np.array([case['frequency'] for case in test_cases], dtype=np.float64)
+    
+    # Calculate required inductance
+    max_current = power / v_out
+    
+    calculator = CircuitCalculator()
+    inputs = BuckInputs(
+        v_in_min=v_in * 0.9,
+        v_in_max=v_in * 1.1,
+        v_out_min=v_out * 0.95,
+        v_out_max=v_out * 1.05,
+        p_out_max=power,
+        efficiency=0.9,
+        switching_freq=frequency,
+        v_ripple_max=0.1,
+        v_in_ripple=0.3,
+        i_out_ripple=max_current * 0.2,
+        v_overshoot=0.1,
+        v_undershoot=0.1,
+        i_loadstep=max_current * 0.5
+    )
+    
+    results = calculator.calculate_buck(inputs)
+    return results.inductance * 1e6, max_current
+
+def _suggest_for_case(case, required_inductance_uh, max_current):
+    """Fetch inductor suggestions for one sized test case"""
+    return suggest_inductors(
+        required_inductance_uh=float(required_inductance_uh),
+        max_current=float(max_current),
+        frequency_hz=case['frequency']
+    )
 
 def test_inductor_recommendations():
     print("🔍 Testing Inductor Recommendations")
     print("=" * 50)
     
-    # Test with the optimized default values from Buck calculator
     test_cases = [
         {
             'name': 'Optimized Defaults (Buck Calculator)',
@@ -39,43 +74,21 @@ def test_inductor_recommendations():
         }
     ]
     
-    for i, case in enumerate(test_cases, 1):
+    required_inductances_uh, max_currents = size_cases(test_cases)
+    
+    # The suggestion searches are independent, so run them concurrently; map()
+    # keeps the results in case order and all printing stays on the main thread
+    with ThreadPoolExecutor() as executor:
+        case_suggestions = list(executor.map(_suggest_for_case, test_cases, required_inductances_uh, max_currents))
+    
+    for i, (case, required_inductance_uh, max_current, suggestions) in enumerate(
+            zip(test_cases, required_inductances_uh, max_currents, case_suggestions), 1):
         print(f"\n📋 Test Case {i}: {case['name']}")
         print("-" * 40)
         
-        # Calculate required inductance
-        max_current = case['power'] / case['v_out']
-        
-        calculator = CircuitCalculator()
-        inputs = BuckInputs(
-            v_in_min=case['v_in'] * 0.9,
-            v_in_max=case['v_in'] * 1.1,
-            v_out_min=case['v_out'] * 0.95,
-            v_out_max=case['v_out'] * 1.05,
-            p_out_max=case['power'],
-            efficiency=0.9,
-            switching_freq=case['frequency'],
-            v_ripple_max=0.1,
-            v_in_ripple=0.3,
-            i_out_ripple=max_current * 0.2,
-            v_overshoot=0.1,
-            v_undershoot=0.1,
-            i_loadstep=max_current * 0.5
-        )
-        
-        results = calculator.calculate_buck(inputs)
-        required_inductance_uh = results.inductance * 1e6
-        
         print(f"Parameters: {case['v_in']}V → {case['v_out']}V, {case['power']}W, {case['frequency']/1000:.0f}kHz")
         print(f"Required: {required_inductance_uh:.1f}µH, {max_current:.2f}A max")
         
-        # Get inductor suggestions
-        suggestions = suggest_inductors(
-            required_inductance_uh=required_inductance_uh,
-            max_current=max_current,
-            frequency_hz=case['frequency']
-        )
-        
         print(f"Results: {len(suggestions)} inductor(s) found")
         
         if suggestions:
@@ -3,16 +3,25 @@
 Test script for the new interactive component display system
 """
 
-import sys
-import os
-
-# Add the project root to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from lib.component_suggestions import suggest_mosfets, suggest_output_capacitors
 from lib.component_display import display_component_table, create_component_table
 import streamlit as st
 
+# Cached wrappers: reruns reuse the previous results (and the display table for
+# the top rows) instead of repeating the database filtering / web scraping
+SUGGESTION_CACHE_TTL = 24 * 60 * 60
+DISPLAY_ROWS = 5
+
+@st.cache_data(ttl=SUGGESTION_CACHE_TTL, show_spinner=False)
+def _cached_mosfets(vin: float, vout: float, iout: float, frequency: float, use_web: bool):
+    suggestions = suggest_mosfets(vin, vout, iout, frequency, use_web_search=use_web, top_k=DISPLAY_ROWS)
+    return suggestions, create_component_table(suggestions[:DISPLAY_ROWS], 'mosfet')
+
+@st.cache_data(ttl=SUGGESTION_CACHE_TTL, show_spinner=False)
+def _cached_output_capacitors(vout: float, iout: float, ripple_current: float, frequency: float, use_web: bool):
+    suggestions = suggest_output_capacitors(vout, iout, ripple_current, frequency, use_web_search=use_web, top_k=DISPLAY_ROWS)
+    return suggestions, create_component_table(suggestions[:DISPLAY_ROWS], 'output_capacitor')
+
 def test_interactive_display():
     """Test the interactive component display functionality"""
     
@@ -24,11 +33,18 @@ def test_interactive_display():
     iout = 10.0
     frequency = 100000.0
     
-    st.write("### Test Configuration:")
-    st.write(f"- Input Voltage: {vin}V")
-    st.write(f"- Output Voltage: {vout}V") 
-    st.write(f"- Output Current: {iout}A")
-    st.write(f"- Switching Frequency: {frequency/1000}kHz")
+    # One markdown element per block instead of one per line
+    st.markdown("\n".join([
+        "### Test Configuration:",
+        f"- Input Voltage: {vin}V",
+        f"- Output Voltage: {vout}V",
+        f"- Output Current: {iout}A",
+        f"- Switching Frequency: {frequency/1000}kHz",
+    ]))
+    
+    # Each source is only searched when shown (st.tabs would still run every tab's body)
+    show_web = st.checkbox("Show web results", value=True)
+    show_local = st.checkbox("Show local results", value=False)
     
     # Test MOSFET suggestions
     st.write("---")
@@ -36,16 +52,17 @@ def test_interactive_display():
     
     try:
         # Get both web and local suggestions
-        web_mosfets = suggest_mosfets(vin, vout, iout, frequency, use_web_search=True)
-        local_mosfets = suggest_mosfets(vin, vout, iout, frequency, use_web_search=False)
+        if show_web:
+            web_mosfets, web_mosfets_table = _cached_mosfets(vin, vout, iout, frequency, True)
+            if web_mosfets:
+                st.write("### Web Search Results:")
+                display_component_table(web_mosfets[:DISPLAY_ROWS], 'mosfet', '🌐 Web MOSFETs', table=web_mosfets_table)
         
-        if web_mosfets:
-            st.write("### Web Search Results:")
-            display_component_table(web_mosfets[:5], 'mosfet', '🌐 Web MOSFETs')
-        
-        if local_mosfets:
-            st.write("### Local Database Results:")
-            display_component_table(local_mosfets[:5], 'mosfet', '📚 Local MOSFETs')
+        if show_local:
+            local_mosfets, local_mosfets_table = _cached_mosfets(vin, vout, iout, frequency, False)
+            if local_mosfets:
+                st.write("### Local Database Results:")
+                display_component_table(local_mosfets[:DISPLAY_ROWS], 'mosfet', '📚 Local MOSFETs', table=local_mosfets_table)
             
     except Exception as e:
         st.error(f"Error testing MOSFET display: {str(e)}")
@@ -59,16 +76,17 @@ def test_interactive_display():
         # Calculate ripple current for capacitors
         ripple_current = 0.4 * iout  # Approximate ripple current
         
-        web_caps = suggest_output_capacitors(vout, iout, ripple_current, frequency, use_web_search=True)
-        local_caps = suggest_output_capacitors(vout, iout, ripple_current, frequency, use_web_search=False)
-        
-        if web_caps:
-            st.write("### Web Search Results:")
-            display_component_table(web_caps[:5], 'output_capacitor', '🌐 Web Capacitors')
+        if show_web:
+            web_caps, web_caps_table = _cached_output_capacitors(vout, iout, ripple_current, frequency, True)
+            if web_caps:
+                st.write("### Web Search Results:")
+                display_component_table(web_caps[:DISPLAY_ROWS], 'output_capacitor', '🌐 Web Capacitors', table=web_caps_table)
         
-        if local_caps:
-            st.write("### Local Database Results:")
-            display_component_table(local_caps[:5], 'output_capacitor', '📚 Local Capacitors')
+        if show_local:
+            local_caps, local_caps_table = _cached_output_capacitors(vout, iout, ripple_current, frequency, False)
+            if local_caps:
+                st.write("### Local Database Results:")
+                display_component_table(local_caps[:DISPLAY_ROWS], 'output_capacitor', '📚 Local Capacitors', table=local_caps_table)
             
     except Exception as e:
         st.error(f"Error testing capacitor display: {str(e)}")
@@ -76,11 +94,13 @@ def test_interactive_display():
     # Display test results
     st.write("---")
     st.write("## ✅ Interactive Display Features:")
-    st.success("✓ Streamlined table with essential metrics only")
-    st.success("✓ Click any row to see detailed component information")
-    st.success("✓ No more count mismatch between table and details")
-    st.success("✓ Professional selection interface with working links")
-    st.success("✓ Dynamic details section appears only when component selected")
+    st.success("  \n".join([
+        "✓ Streamlined table with essential metrics only",
+        "✓ Click any row to see detailed component information",
+        "✓ No more count mismatch between table and details",
+        "✓ Professional selection interface with working links",
+        "✓ Dynamic details section appears only when component selected",
+    ]))
     
     st.info("💡 **How to use:** Click on any row in the table above to see detailed specs, purchase links, and selection reasoning.")
 
@@ -5,40 +5,188 @@ Validates all fixes for web component selection issues
 """
 
 import streamlit as st
+import pandas as pd
 import traceback
-import sys
-import os
+from lib import component_suggestions
+from lib.component_display import SUGGESTION_KEYS_STATE, clear_stored_suggestions, create_component_table, display_component_table
+from lib.streamlit_utils import fragment, script_thread_pool
 
-# Add the project root to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Reruns with unchanged parameters reuse cached suggestions (and the table of the
+# displayed rows) instead of repeating the local filtering / web scraping
+SUGGESTION_CACHE_TTL = 60 * 60
+DISPLAY_ROWS = 5
 
-def test_component_safely(component_func, component_type, params, use_web):
+@st.cache_data(ttl=SUGGESTION_CACHE_TTL, show_spinner=False)
+def _cached_suggestions(_component_func, component_type, params, use_web):
+    """Cached component_func(**params) call, keyed on component type, parameters and source"""
+    suggestions = _component_func(**dict(params), use_web_search=use_web)
+    return suggestions, create_component_table(suggestions[:DISPLAY_ROWS], component_type)
+
+def _run_search(function_name, component_type, params, use_web):
+    """Look up a suggest_* function by name and run it through the suggestion cache"""
+    component_func = getattr(component_suggestions, function_name)
+    return _cached_suggestions(component_func, component_type, tuple(sorted(params.items())), use_web)
+
+def test_component_safely(search, component_type, params, use_web):
     """Test component with comprehensive error handling"""
     try:
         with st.spinner(f"Searching for {component_type}s..."):
-            suggestions = component_func(**params, use_web_search=use_web)
+            suggestions, top_table = search.result()
         
-        if suggestions:
-            from lib.component_display import display_component_table
-            display_component_table(suggestions[:5], component_type, 
-                                  f'{component_type.title().replace("_", " ")} Results')
-            return len(suggestions), None
-        else:
+        if not suggestions:
             st.warning(f"⚠️ No {component_type}s found matching your requirements")
             return 0, None
+        
+        # The count reported below is for the full list; only the top rows are shown
+        display_component_table(suggestions[:DISPLAY_ROWS], component_type, 
+                              f'{component_type.title().replace("_", " ")} Results',
+                              table=top_table)
+        return len(suggestions), None
             
     except Exception as e:
         error_msg = f"Error searching for {component_type}: {str(e)}"
         st.error(f"❌ {error_msg}")
         
         with st.expander(f"🔍 Debug {component_type} error"):
-            st.code(traceback.format_exc())
+            # Expander bodies always run, so only format the traceback on request
+            if st.checkbox("Show traceback", key=f"show_traceback_{component_type}"):
+                st.code("".join(traceback.format_exception(type(e), e, e.__traceback__)))
             st.write("**Parameters used:**")
             st.json(params)
             st.write(f"**Use web search:** {use_web}")
         
         return 0, error_msg
 
+@st.cache_data(show_spinner=False)
+def _component_requirements(vin, vout, iout, frequency, voltage_derating, current_derating):
+    """Derived selection requirements shared by the search parameters and the criteria text"""
+    duty_cycle = vout / vin
+    ripple_ratio = 0.3  # 30% current ripple
+    return {
+        'max_voltage_req': vin / voltage_derating,
+        'max_current_req': iout / current_derating,
+        'ripple_current': 0.4 * iout,  # Typical buck converter
+        'min_voltage_req': vout * 1.2,  # 20% margin
+        'input_ripple_current': 0.3 * iout,
+        'min_input_voltage': vin * 1.1,  # 10% margin
+        'inductance_uh': (vin * duty_cycle * (1 - duty_cycle)) / (ripple_ratio * iout * frequency) * 1e6,
+        'current_rating_req': iout * 1.2,  # 20% margin
+    }
+
+def _component_searches(req, vin, vout, iout, frequency):
+    """suggest_* function name and keyword arguments for each component test"""
+    return {
+        'mosfet': ('suggest_mosfets', {
+            'max_voltage': req['max_voltage_req'],
+            'max_current': req['max_current_req'],
+            'frequency_hz': frequency
+        }),
+        'output_capacitor': ('suggest_output_capacitors', {
+            'output_voltage': vout,
+            'output_current': iout,
+            'ripple_current': req['ripple_current'],
+            'switching_frequency': frequency
+        }),
+        'input_capacitor': ('suggest_input_capacitors', {
+            'input_voltage': vin,
+            'output_current': iout,
+            'ripple_current': req['input_ripple_current']
+        }),
+        'inductor': ('suggest_inductors', {
+            'inductance': req['inductance_uh'] / 1e6,  # Convert to H
+            'max_current': req['current_rating_req']
+        }),
+    }
+
+# Heading and selection criteria for each tab, filled from the derived requirements
+# with str.format so each tab renders them in a single st.markdown call
+_MOSFET_TEMPLATE = """### 💻 MOSFET Selection Test
+
+**📊 Selection Criteria:**
+- **VDS Rating:** ≥ {max_voltage_req:.1f}V (derated from {vin}V)
+- **ID Rating:** ≥ {max_current_req:.1f}A (derated from {iout}A)
+- **Switching Frequency:** {freq_khz}kHz compatibility
+"""
+
+_OUTPUT_CAP_TEMPLATE = """### 📤 Output Capacitor Selection Test
+
+**📊 Selection Criteria:**
+- **Voltage Rating:** ≥ {min_voltage_req:.1f}V (120% of {vout}V)
+- **Ripple Current:** ≥ {ripple_current:.2f}A RMS
+- **Low ESR:** For efficient filtering
+"""
+
+_INPUT_CAP_TEMPLATE = """### 📥 Input Capacitor Selection Test
+
+**📊 Selection Criteria:**
+- **Voltage Rating:** ≥ {min_input_voltage:.1f}V (110% of {vin}V)
+- **Ripple Current:** ≥ {input_ripple_current:.2f}A RMS
+- **High Frequency Response:** For switching noise
+"""
+
+_INDUCTOR_TEMPLATE = """### 🧲 Inductor Selection Test
+
+**📊 Selection Criteria:**
+- **Inductance:** ≈ {inductance_uh:.0f}µH (calculated for 30% ripple)
+- **Current Rating:** ≥ {current_rating_req:.1f}A (120% of {iout}A)
+- **DC Resistance:** Low for efficiency
+"""
+
+@fragment
+def _mosfet_fragment(search, params, req, vin, vout, iout, freq_khz, use_web):
+    """MOSFET selection test; reruns from its own widgets stay inside this fragment"""
+    st.markdown(_MOSFET_TEMPLATE.format(**req, vin=vin, vout=vout, iout=iout, freq_khz=freq_khz))
+    
+    count, error = test_component_safely(search, 'mosfet', params, use_web)
+    
+    st.session_state.test_results['MOSFETs'] = {'count': count, 'error': error}
+
+@fragment
+def _output_cap_fragment(search, params, req, vin, vout, iout, freq_khz, use_web):
+    """Output capacitor selection test; reruns from its own widgets stay inside this fragment"""
+    st.markdown(_OUTPUT_CAP_TEMPLATE.format(**req, vin=vin, vout=vout, iout=iout, freq_khz=freq_khz))
+    
+    count, error = test_component_safely(search, 'output_capacitor', params, use_web)
+    
+    st.session_state.test_results['Output Capacitors'] = {'count': count, 'error': error}
+
+@fragment
+def _input_cap_fragment(search, params, req, vin, vout, iout, freq_khz, use_web):
+    """Input capacitor selection test; reruns from its own widgets stay inside this fragment"""
+    st.markdown(_INPUT_CAP_TEMPLATE.format(**req, vin=vin, vout=vout, iout=iout, freq_khz=freq_khz))
+    
+    count, error = test_component_safely(search, 'input_capacitor', params, use_web)
+    
+    st.session_state.test_results['Input Capacitors'] = {'count': count, 'error': error}
+
+@fragment
+def _inductor_fragment(search, params, req, vin, vout, iout, freq_khz, use_web):
+    """Inductor selection test; reruns from its own widgets stay inside this fragment"""
+    st.markdown(_INDUCTOR_TEMPLATE.format(**req, vin=vin, vout=vout, iout=iout, freq_khz=freq_khz))
+    
+    count, error = test_component_safely(search, 'inductor', params, use_web)
+    
+    st.session_state.test_results['Inductors'] = {'count': count, 'error': error}
+
+@fragment
+def _debug_fragment(use_web, vin, vout, iout, frequency, test_results):
+    """Debug panel; toggling it reruns only this fragment, and the data is built only when shown"""
+    if st.checkbox("🔍 Show Debug Information"):
+        st.markdown("### 🛠️ Debug Information")
+        
+        debug_data = {
+            'session_component_source': st.session_state.get('component_source', 'not set'),
+            'use_web_search': use_web,
+            'circuit_parameters': {
+                'vin': vin, 'vout': vout, 'iout': iout, 'frequency': frequency
+            },
+            'active_session_keys': sorted(k for k in st.session_state if not k.startswith('_')),
+            'stored_suggestions': sorted(st.session_state.get(SUGGESTION_KEYS_STATE, ())),
+            'test_results_summary': test_results
+        }
+        
+        st.json(debug_data)
+
 def main():
     """Polished test interface"""
     
@@ -86,20 +234,24 @@ def main():
         
         st.divider()
         
-        # Circuit parameters
-        st.subheader("⚡ Buck Converter Specs")
-        vin = st.slider("Input Voltage (V)", 12.0, 48.0, 24.0, 0.5, help="DC input voltage")
-        vout = st.slider("Output Voltage (V)", 1.2, 24.0, 5.0, 0.1, help="Regulated output voltage")  
-        iout = st.slider("Output Current (A)", 0.5, 50.0, 10.0, 0.5, help="Maximum output current")
-        freq_khz = st.slider("Switching Freq (kHz)", 20, 1000, 100, 10, help="PWM switching frequency")
-        frequency = freq_khz * 1000
-        
-        st.divider()
-        
-        # Safety margins
-        st.subheader("🛡️ Design Margins")  
-        voltage_derating = st.slider("Voltage Derating (%)", 20, 100, 50, 5, help="Safety margin for voltage ratings") / 100
-        current_derating = st.slider("Current Derating (%)", 20, 100, 80, 5, help="Safety margin for current ratings") / 100
+        # Circuit parameters and margins are applied together on submit, so
+        # adjusting several sliders costs one rerun instead of one per slider
+        with st.form("test_config"):
+            st.subheader("⚡ Buck Converter Specs")
+            vin = st.slider("Input Voltage (V)", 12.0, 48.0, 24.0, 0.5, help="DC input voltage")
+            vout = st.slider("Output Voltage (V)", 1.2, 24.0, 5.0, 0.1, help="Regulated output voltage")  
+            iout = st.slider("Output Current (A)", 0.5, 50.0, 10.0, 0.5, help="Maximum output current")
+            freq_khz = st.slider("Switching Freq (kHz)", 20, 1000, 100, 10, help="PWM switching frequency")
+            frequency = freq_khz * 1000
+            
+            st.divider()
+            
+            # Safety margins
+            st.subheader("🛡️ Design Margins")  
+            voltage_derating = st.slider("Voltage Derating (%)", 20, 100, 50, 5, help="Safety margin for voltage ratings") / 100
+            current_derating = st.slider("Current Derating (%)", 20, 100, 80, 5, help="Safety margin for current ratings") / 100
+            
+            st.form_submit_button("▶️ Run Tests", use_container_width=True)
         
         st.divider()
         
@@ -107,9 +259,8 @@ def main():
         st.subheader("🧪 Test Controls")
         if st.button("🔄 **Refresh All Tests**", type="primary", use_container_width=True):
             # Clear cached results
-            for key in list(st.session_state.keys()):
-                if key.endswith('_suggestions'):
-                    del st.session_state[key]
+            clear_stored_suggestions()
+            _cached_suggestions.clear()
             st.rerun()
         
         if st.button("🗑️ Clear Session", use_container_width=True):
@@ -150,148 +301,63 @@ def main():
     # Component testing tabs
     st.subheader("🔬 Component Selection Tests")
     
-    # Track test results
-    test_results = {}
+    # Track test results (each tab fragment records its own entry)
+    st.session_state.test_results = {}
+    
+    req = _component_requirements(vin, vout, iout, frequency, voltage_derating, current_derating)
+    searches = _component_searches(req, vin, vout, iout, frequency)
     
     # Create tabs for each component type
     mosfet_tab, output_cap_tab, input_cap_tab, inductor_tab = st.tabs([
         "💻 MOSFETs", "📤 Output Capacitors", "📥 Input Capacitors", "🧲 Inductors"
     ])
     
-    with mosfet_tab:
-        st.markdown("### 💻 MOSFET Selection Test")
-        
-        # Calculate requirements
-        max_voltage_req = vin / voltage_derating
-        max_current_req = iout / current_derating
-        
-        st.markdown(f"""
-        **📊 Selection Criteria:**
-        - **VDS Rating:** ≥ {max_voltage_req:.1f}V (derated from {vin}V)
-        - **ID Rating:** ≥ {max_current_req:.1f}A (derated from {iout}A)
-        - **Switching Frequency:** {freq_khz}kHz compatibility
-        """)
-        
-        from lib.component_suggestions import suggest_mosfets
-        
-        count, error = test_component_safely(
-            suggest_mosfets, 'mosfet',
-            {
-                'max_voltage': max_voltage_req,
-                'max_current': max_current_req,
-                'frequency_hz': frequency
-            },
-            use_web
-        )
-        
-        test_results['MOSFETs'] = {'count': count, 'error': error}
-    
-    with output_cap_tab:
-        st.markdown("### 📤 Output Capacitor Selection Test")
-        
-        # Calculate ripple current (typical buck converter)
-        ripple_current = 0.4 * iout
-        min_voltage_req = vout * 1.2  # 20% margin
-        
-        st.markdown(f"""
-        **📊 Selection Criteria:**
-        - **Voltage Rating:** ≥ {min_voltage_req:.1f}V (120% of {vout}V)
-        - **Ripple Current:** ≥ {ripple_current:.2f}A RMS
-        - **Low ESR:** For efficient filtering
-        """)
-        
-        from lib.component_suggestions import suggest_output_capacitors
-        
-        count, error = test_component_safely(
-            suggest_output_capacitors, 'output_capacitor',
-            {
-                'output_voltage': vout,
-                'output_current': iout,
-                'ripple_current': ripple_current,
-                'switching_frequency': frequency
-            },
-            use_web
-        )
-        
-        test_results['Output Capacitors'] = {'count': count, 'error': error}
-    
-    with input_cap_tab:
-        st.markdown("### 📥 Input Capacitor Selection Test")
-        
-        # Input capacitor requirements
-        input_ripple_current = 0.3 * iout
-        min_input_voltage = vin * 1.1  # 10% margin
-        
-        st.markdown(f"""
-        **📊 Selection Criteria:**
-        - **Voltage Rating:** ≥ {min_input_voltage:.1f}V (110% of {vin}V)
-        - **Ripple Current:** ≥ {input_ripple_current:.2f}A RMS
-        - **High Frequency Response:** For switching noise
-        """)
-        
-        from lib.component_suggestions import suggest_input_capacitors
-        
-        count, error = test_component_safely(
-            suggest_input_capacitors, 'input_capacitor',
-            {
-                'input_voltage': vin,
-                'output_current': iout,
-                'ripple_current': input_ripple_current
-            },
-            use_web
-        )
-        
-        test_results['Input Capacitors'] = {'count': count, 'error': error}
-    
-    with inductor_tab:
-        st.markdown("### 🧲 Inductor Selection Test")
-        
-        # Calculate inductance (buck converter formula)
-        duty_cycle = vout / vin
-        ripple_ratio = 0.3  # 30% current ripple
-        inductance_uh = (vin * duty_cycle * (1 - duty_cycle)) / (ripple_ratio * iout * frequency) * 1e6
-        current_rating_req = iout * 1.2  # 20% margin
+    # The four searches are independent (and I/O-bound in web mode), so start them
+    # all at once; the workers share this run's context so warnings and progress
+    # from the searches still render, and each tab renders once its result is in
+    with script_thread_pool(max_workers=4) as executor:
+        futures = {
+            component_type: executor.submit(_run_search, function_name, component_type, params, use_web)
+            for component_type, (function_name, params) in searches.items()
+        }
         
-        st.markdown(f"""
-        **📊 Selection Criteria:**
-        - **Inductance:** ≈ {inductance_uh:.0f}µH (calculated for 30% ripple)
-        - **Current Rating:** ≥ {current_rating_req:.1f}A (120% of {iout}A)
-        - **DC Resistance:** Low for efficiency
-        """)
+        with mosfet_tab:
+            _mosfet_fragment(futures['mosfet'], searches['mosfet'][1], req, vin, vout, iout, freq_khz, use_web)
         
-        from lib.component_suggestions import suggest_inductors
+        with output_cap_tab:
+            _output_cap_fragment(futures['output_capacitor'], searches['output_capacitor'][1], req, vin, vout, iout, freq_khz, use_web)
         
-        count, error = test_component_safely(
-            suggest_inductors, 'inductor',
-            {
-                'inductance': inductance_uh / 1e6,  # Convert to H
-                'max_current': current_rating_req
-            },
-            use_web
-        )
+        with input_cap_tab:
+            _input_cap_fragment(futures['input_capacitor'], searches['input_capacitor'][1], req, vin, vout, iout, freq_khz, use_web)
         
-        test_results['Inductors'] = {'count': count, 'error': error}
+        with inductor_tab:
+            _inductor_fragment(futures['inductor'], searches['inductor'][1], req, vin, vout, iout, freq_khz, use_web)
     
     # Test results summary
+    test_results = st.session_state.test_results
     st.markdown("---")
     st.subheader("📈 Test Results Summary")
     
     # Overall metrics
-    total_components = sum(result['count'] for result in test_results.values())
-    successful_tests = sum(1 for result in test_results.values() if result['error'] is None)
+    total_components = successful_tests = 0
+    for result in test_results.values():
+        total_components += result['count']
+        successful_tests += result['error'] is None
     total_tests = len(test_results)
     
-    summary_col1, summary_col2, summary_col3, summary_col4 = st.columns(4)
+    success_rate = (successful_tests / total_tests * 100) if total_tests > 0 else 0
     
-    with summary_col1:
-        st.metric("🎯 Total Components", total_components)
-    with summary_col2:
-        st.metric("✅ Successful Tests", f"{successful_tests}/{total_tests}")
-    with summary_col3:
-        success_rate = (successful_tests / total_tests * 100) if total_tests > 0 else 0
-        st.metric("📊 Success Rate", f"{success_rate:.0f}%")
-    with summary_col4:
-        st.metric("🔍 Search Mode", "🌐 Web" if use_web else "📚 Local")
+    # One table element for the four summary figures instead of four metric widgets
+    st.dataframe(
+        pd.DataFrame({
+            "🎯 Total Components": [total_components],
+            "✅ Successful Tests": [f"{successful_tests}/{total_tests}"],
+            "📊 Success Rate": [f"{success_rate:.0f}%"],
+            "🔍 Search Mode": ["🌐 Web" if use_web else "📚 Local"],
+        }),
+        hide_index=True,
+        use_container_width=True
+    )
     
     # Detailed results table
     with st.expander("📋 Detailed Test Results", expanded=total_components == 0):
@@ -360,21 +426,7 @@ def main():
         """)
     
     # Debug section
-    if st.checkbox("🔍 Show Debug Information"):
-        st.markdown("### 🛠️ Debug Information")
-        
-        debug_data = {
-            'session_component_source': st.session_state.get('component_source', 'not set'),
-            'use_web_search': use_web,
-            'circuit_parameters': {
-                'vin': vin, 'vout': vout, 'iout': iout, 'frequency': frequency
-            },
-            'active_session_keys': [k for k in st.session_state.keys() if not k.startswith('_')],
-            'stored_suggestions': [k for k in st.session_state.keys() if k.endswith('_suggestions')],
-            'test_results_summary': test_results
-        }
-        
-        st.json(debug_data)
+    _debug_fragment(use_web, vin, vout, iout, frequency, test_results)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
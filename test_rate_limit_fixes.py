@@ -2,20 +2,17 @@
 Test the improved web scraping with rate limiting fixes
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 def test_improved_web_search():
     """Test web search with improved rate limiting"""
     print("🧪 Testing Improved Web Component Search")
     print("=" * 50)
     
     try:
-        from lib.web_component_scraper import WebComponentScraper
+        from lib.web_component_scraper import get_web_scraper
         
-        # Test with a simple search that's less likely to trigger rate limits
-        scraper = WebComponentScraper()
+        # Test with a simple search that's less likely to trigger rate limits;
+        # the shared scraper keeps its session and rate-limit state between runs
+        scraper = get_web_scraper()
         print("✅ Web scraper initialized with improved rate limiting (3s intervals)")
         
         # Test fallback behavior
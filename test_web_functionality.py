@@ -2,12 +2,15 @@
 Test script for web component scraping functionality
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import importlib.util
 
 def test_web_scraper_import():
     """Test if web scraper module can be imported"""
+    # Cheap existence probe first; only import (and pull in requests/bs4) if it is there
+    if importlib.util.find_spec('lib.web_component_scraper') is None:
+        print("❌ Import error: lib.web_component_scraper not found")
+        return False
+    
     try:
         from lib.web_component_scraper import WebComponentScraper, is_web_search_available
         print("✅ Web scraper module imported successfully")
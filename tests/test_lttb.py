@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Ensure project root is on sys.path for imports
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lib.simulation_service import downsample_lttb
+
+
+class TestLTTBDownsampling(unittest.TestCase):
+    def test_reduces_to_requested_points_and_keeps_endpoints(self):
+        t = np.linspace(0, 1e-3, 20000)
+        v = 5.0 + 0.1 * np.sin(2 * np.pi * 100e3 * t)
+
+        t_ds, v_ds = downsample_lttb(t, v, 2000)
+
+        self.assertEqual(len(t_ds), 2000)
+        self.assertEqual(len(v_ds), 2000)
+        self.assertEqual(t_ds[0], t[0])
+        self.assertEqual(t_ds[-1], t[-1])
+        self.assertTrue(np.all(np.diff(t_ds) > 0))
+
+    def test_preserves_waveform_extremes(self):
+        t = np.linspace(0, 1e-3, 20000)
+        v = 5.0 + 0.1 * np.sin(2 * np.pi * 100e3 * t)
+
+        _, v_ds = downsample_lttb(t, v, 2000)
+
+        self.assertAlmostEqual(v_ds.max(), v.max(), places=3)
+        self.assertAlmostEqual(v_ds.min(), v.min(), places=3)
+
+    def test_short_traces_are_returned_unchanged(self):
+        t = [0.0, 1.0, 2.0]
+        v = [1.0, 2.0, 3.0]
+
+        t_ds, v_ds = downsample_lttb(t, v, 2000)
+
+        np.testing.assert_array_equal(t_ds, t)
+        np.testing.assert_array_equal(v_ds, v)
+
+
+if __name__ == '__main__':
+    unittest.main()
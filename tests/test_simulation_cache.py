@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# Ensure project root is on sys.path for imports
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lib.simulation_service import load_simulation_results, save_simulation_results
+
+
+class SimulationResultCacheTest(unittest.TestCase):
+    def test_round_trip_preserves_waveforms_and_analysis(self):
+        t = np.linspace(0, 1e-3, 500)
+        results = {
+            'success': True,
+            'netlist': '* test netlist',
+            'raw_results': {
+                'time': t.tolist(),
+                'voltages': {'V(out)': (5.0 + 0.01 * np.sin(t)).tolist(), 'V(sw)': [12.0] * len(t)},
+                'currents': {'I(L1)': [2.0] * len(t)},
+                'analysis_type': 'transient',
+            },
+            'analysis': {'output_voltage': {'average': 5.0, 'ripple_pk_pk': 0.02}, 'settling_time': 0.1},
+            'simulator_type': 'CloudSimulator',
+        }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            waveform_path = os.path.join(tmp, 'demo.parquet')
+            meta_path = os.path.join(tmp, 'demo_meta.json')
+            save_simulation_results(results, waveform_path, meta_path)
+            loaded = load_simulation_results(waveform_path, meta_path)
+
+        self.assertTrue(loaded['success'])
+        self.assertEqual(loaded['netlist'], results['netlist'])
+        self.assertEqual(loaded['analysis'], results['analysis'])
+        np.testing.assert_array_equal(loaded['raw_results']['time'], t)
+        np.testing.assert_array_equal(
+            loaded['raw_results']['voltages']['V(out)'], results['raw_results']['voltages']['V(out)']
+        )
+        self.assertEqual(list(loaded['raw_results']['currents']), ['I(L1)'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import os
+import sys
+import unittest
+
+from streamlit.testing.v1 import AppTest
+
+# Ensure project root is on sys.path for imports
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lib.streamlit_utils import script_thread_pool
+
+
+def _worker_warning_app():
+    import streamlit as st
+    from lib.streamlit_utils import script_thread_pool
+
+    def search():
+        st.warning("Rate limited by server")
+        return 3
+
+    with script_thread_pool(max_workers=1) as executor:
+        st.write(f"Found {executor.submit(search).result()}")
+
+
+class ScriptThreadPoolTest(unittest.TestCase):
+    def test_worker_output_renders_in_the_script_run(self):
+        at = AppTest.from_function(_worker_warning_app).run()
+
+        self.assertFalse(at.exception)
+        self.assertEqual([w.value for w in at.warning], ["Rate limited by server"])
+        self.assertEqual(at.markdown[0].value, "Found 3")
+
+    def test_works_outside_a_script_run(self):
+        with script_thread_pool(max_workers=2) as executor:
+            self.assertEqual(list(executor.map(abs, [-1, -2])), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
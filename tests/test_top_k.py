@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Ensure project root is on sys.path for imports
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lib.component_suggestions import _top_k_indices, suggest_mosfets
+
+
+class TopKIndicesTest(unittest.TestCase):
+    def test_matches_stable_descending_sort(self):
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            scores = rng.integers(0, 5, size=rng.integers(0, 20)).astype(float)
+            for k in (0, 1, 3, 5, 25):
+                np.testing.assert_array_equal(
+                    _top_k_indices(scores, k),
+                    np.argsort(-scores, kind='stable')[:k],
+                )
+
+    def test_ties_keep_input_order(self):
+        scores = np.array([1.0, 3.0, 2.0, 3.0, 2.0, 3.0])
+
+        np.testing.assert_array_equal(_top_k_indices(scores, 4), [1, 3, 5, 2])
+
+    def test_suggesters_honour_top_k(self):
+        top_three = suggest_mosfets(48, 5, top_k=3)
+        top_five = suggest_mosfets(48, 5)
+
+        self.assertLessEqual(len(top_three), 3)
+        self.assertEqual(
+            [s.component.name for s in top_three],
+            [s.component.name for s in top_five[:3]],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()